@@ -84,6 +84,46 @@ export default function HomePage() {
     })();
   }, []);
 
+  // Live updates instead of refetching whole lists
+  useEffect(() => {
+    if (!token || typeof window === 'undefined') return;
+    const source = new EventSource(
+      `${API_BASE_URL}/events?access_token=${encodeURIComponent(token)}`,
+    );
+    source.addEventListener('tender', (e) => {
+      const { tender_id, tender } = JSON.parse((e as MessageEvent).data);
+      setTenders((prev) => {
+        if (!tender) return prev.filter((t) => t.id !== tender_id);
+        if (prev.some((t) => t.id === tender_id)) {
+          return prev.map((t) => (t.id === tender_id ? { ...t, ...tender } : t));
+        }
+        return [tender, ...prev];
+      });
+    });
+    source.addEventListener('submission', (e) => {
+      const { submission } = JSON.parse((e as MessageEvent).data);
+      if (!submission) return;
+      setMySubmissions((prev) =>
+        prev.some((s) => s.id === submission.id)
+          ? prev.map((s) => (s.id === submission.id ? submission : s))
+          : [submission, ...prev],
+      );
+    });
+    source.addEventListener('submission_count', (e) => {
+      const { tender_id, submission_count } = JSON.parse((e as MessageEvent).data);
+      setTenders((prev) =>
+        prev.map((t) => (t.id === tender_id ? { ...t, submission_count } : t)),
+      );
+    });
+    source.addEventListener('audit', (e) => {
+      const entry = JSON.parse((e as MessageEvent).data) as AuditLog;
+      setAuditLogs((prev) =>
+        prev.some((l) => l.id === entry.id) ? prev : [entry, ...prev],
+      );
+    });
+    return () => source.close();
+  }, [token]);
+
   async function handleLogin(e: React.FormEvent) {
     e.preventDefault();
     setError(null);
@@ -145,7 +185,7 @@ export default function HomePage() {
   async function fetchTendersWithToken(accessToken: string) {
     setLoadingTenders(true);
     try {
-      const res = await fetch(`${API_BASE_URL}/tenders`, {
+      const res = await fetch(`${API_BASE_URL}/tenders?include_stats=true`, {
         headers: { Authorization: `Bearer ${accessToken}` },
       });
       if (!res.ok) throw new Error(await res.text());
@@ -200,7 +240,7 @@ export default function HomePage() {
       });
       if (!res.ok) throw new Error(await res.text());
       const created = await res.json();
-      setTenders((prev) => [created, ...prev]);
+      setTenders((prev) => [created, ...prev.filter((t) => t.id !== created.id)]);
     } catch (err: any) {
       setError(err.message ?? 'Failed to create tender');
     }
@@ -216,7 +256,7 @@ export default function HomePage() {
       });
       if (!res.ok) throw new Error(await res.text());
       const updated = await res.json();
-      setTenders((prev) => prev.map((t) => (t.id === updated.id ? updated : t)));
+      setTenders((prev) => prev.map((t) => (t.id === updated.id ? { ...t, ...updated } : t)));
     } catch (err: any) {
       setError(err.message);
     }
@@ -231,7 +271,7 @@ export default function HomePage() {
       });
       if (!res.ok) throw new Error(await res.text());
       const updated = await res.json();
-      setTenders((prev) => prev.map((t) => (t.id === updated.id ? updated : t)));
+      setTenders((prev) => prev.map((t) => (t.id === updated.id ? { ...t, ...updated } : t)));
     } catch (err: any) {
       setError(err.message);
     }
@@ -296,7 +336,7 @@ export default function HomePage() {
       });
       if (!res.ok) throw new Error(await res.text());
       const created = await res.json();
-      setMySubmissions((prev) => [created, ...prev]);
+      setMySubmissions((prev) => [created, ...prev.filter((s) => s.id !== created.id)]);
       setSelectedTenderForBid(null);
     } catch (err: any) {
       setError(err.message);
@@ -316,7 +356,7 @@ export default function HomePage() {
       });
       if (!res.ok) throw new Error(await res.text());
       const updated = await res.json();
-      setTenders((prev) => prev.map((t) => (t.id === updated.id ? updated : t)));
+      setTenders((prev) => prev.map((t) => (t.id === updated.id ? { ...t, ...updated } : t)));
     } catch (err: any) {
       setError(err.message);
     } finally {
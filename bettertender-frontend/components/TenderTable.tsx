@@ -109,6 +109,7 @@ export default function TenderTable({
                                             className="rounded border border-slate-400 text-slate-700 px-2 py-0.5 hover:bg-slate-50"
                                         >
                                             Submissions
+                                            {t.submission_count != null && ` (${t.submission_count})`}
                                         </button>
                                     )}
                                     {me && (
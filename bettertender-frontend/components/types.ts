@@ -25,6 +25,7 @@ export type Tender = {
     status: TenderStatus;
     created_at: string;
     owner_id?: number;
+    submission_count?: number;
 };
 
 export type Submission = {
@@ -0,0 +1,23 @@
+"""Import the app against a throwaway database and upload directory.
+
+``bettertender_simple`` reads its configuration at import time, so the
+environment has to be prepared before the first import; both the pytest
+suite and the load scenario import the module from here.
+"""
+import os
+import sys
+import tempfile
+
+WORKDIR = tempfile.mkdtemp(prefix="bt-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{WORKDIR}/bench.db")
+os.environ.setdefault("TENDER_SCHEDULER_ENABLED", "false")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+_cwd = os.getcwd()
+os.chdir(WORKDIR)  # upload and journal directories are derived from the cwd
+try:
+    import bettertender_simple as bt  # noqa: E402,F401
+finally:
+    os.chdir(_cwd)
+
+DEV_PASSWORD = "ChangeMe123!"
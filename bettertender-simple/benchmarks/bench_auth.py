@@ -0,0 +1,29 @@
+from _env import DEV_PASSWORD, bt
+
+
+def bench_login(benchmark, client):
+    form = {"username": "bidder@sasweb.gov", "password": DEV_PASSWORD}
+
+    def login():
+        response = client.post("/auth/login", data=form)
+        assert response.status_code == 200
+
+    benchmark(login)
+
+
+def bench_current_user_cached(benchmark, client, auth):
+    def me():
+        assert client.get("/auth/me", headers=auth["bidder"]).status_code == 200
+
+    benchmark(me)
+
+
+def bench_current_user_uncached(benchmark, client, auth):
+    def me():
+        assert client.get("/auth/me", headers=auth["bidder"]).status_code == 200
+
+    benchmark.pedantic(
+        me,
+        setup=lambda: bt.principal_cache.invalidate("bidder@sasweb.gov"),
+        rounds=200,
+    )
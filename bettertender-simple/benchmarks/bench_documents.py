@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+PAYLOAD = os.urandom(1024 * 1024)
+
+
+@pytest.fixture(scope="module")
+def document_id(client, auth, tender_id):
+    response = client.post(
+        "/documents",
+        files={"file": ("spec.bin", PAYLOAD)},
+        params={"tender_id": tender_id, "visibility": "public"},
+        headers=auth["issuer"],
+    )
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+def bench_upload_1mib(benchmark, client, auth, tender_id):
+    def upload(content):
+        response = client.post(
+            "/documents",
+            files={"file": ("spec.bin", content)},
+            params={"tender_id": tender_id, "visibility": "internal"},
+            headers=auth["issuer"],
+        )
+        assert response.status_code == 201
+
+    # New content every round; a repeated payload would only time the dedup path.
+    benchmark.pedantic(
+        upload, setup=lambda: ((os.urandom(len(PAYLOAD)),), {}), rounds=50, warmup_rounds=2
+    )
+
+
+def bench_download_1mib(benchmark, client, auth, document_id):
+    def download():
+        response = client.get(f"/documents/{document_id}", headers=auth["bidder"])
+        assert response.status_code == 200 and len(response.content) == len(PAYLOAD)
+
+    benchmark(download)
+
+
+def bench_download_range(benchmark, client, auth, document_id):
+    headers = {**auth["bidder"], "Range": "bytes=0-65535"}
+
+    def download():
+        assert client.get(f"/documents/{document_id}", headers=headers).status_code == 206
+
+    benchmark(download)
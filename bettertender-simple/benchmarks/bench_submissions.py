@@ -0,0 +1,55 @@
+from _env import bt
+
+
+def bench_create_submission(benchmark, client, auth, tender_id):
+    body = {"amount": 950000, "bbbee_level": "2", "company_name": "Bench (Pty) Ltd"}
+
+    def submit():
+        response = client.post(f"/tenders/{tender_id}/submissions", json=body, headers=auth["bidder"])
+        assert response.status_code == 201
+
+    benchmark(submit)
+
+
+def bench_queue_submission(benchmark, client, auth, tender_id):
+    body = {"amount": 940000, "is_anonymous": True, "payload": "sealed", "nonce": "bench-nonce-1"}
+
+    def submit():
+        response = client.post(
+            f"/tenders/{tender_id}/submissions/queued", json=body, headers=auth["bidder"]
+        )
+        assert response.status_code == 202
+
+    benchmark(submit)
+
+
+def bench_audit_append(benchmark, client):
+    db = bt.SessionLocal()
+
+    def append():
+        bt.audit_chain.append(
+            db,
+            actor_id=None,
+            action="benchmark",
+            resource_type="benchmark",
+            payload={"n": 1},
+        )
+
+    try:
+        benchmark(append)
+    finally:
+        db.close()
+
+
+def bench_tender_ranking_uncached(benchmark, client, auth, tender_id):
+    for i in range(200):
+        client.post(
+            f"/tenders/{tender_id}/submissions",
+            json={"amount": 900000 + i, "bbbee_level": str(i % 9)},
+            headers=auth["bidder"],
+        )
+
+    def rank():
+        assert client.get(f"/tenders/{tender_id}/ranking", headers=auth["issuer"]).status_code == 200
+
+    benchmark.pedantic(rank, setup=lambda: bt.invalidate_tender_ranking(tender_id), rounds=100)
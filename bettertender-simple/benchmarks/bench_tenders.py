@@ -0,0 +1,32 @@
+from _env import bt
+
+
+def bench_list_tenders_cached(benchmark, client, tender_id):
+    def list_page():
+        assert client.get("/tenders", params={"limit": 100}).status_code == 200
+
+    benchmark(list_page)
+
+
+def bench_list_tenders_uncached(benchmark, client, tender_id):
+    def list_page():
+        assert client.get("/tenders", params={"limit": 100}).status_code == 200
+
+    benchmark.pedantic(list_page, setup=bt.tender_list_cache.invalidate, rounds=200)
+
+
+def bench_list_tenders_not_modified(benchmark, client, tender_id):
+    etag = client.get("/tenders", params={"limit": 100}).headers["ETag"]
+
+    def revalidate():
+        response = client.get("/tenders", params={"limit": 100}, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    benchmark(revalidate)
+
+
+def bench_search_tenders(benchmark, client, tender_id):
+    def search():
+        assert client.get("/tenders/search", params={"q": "road lot 42"}).status_code == 200
+
+    benchmark(search)
@@ -0,0 +1,53 @@
+"""Shared fixtures for the benchmark suite; see pytest.ini for how to run it."""
+import pytest
+from fastapi.testclient import TestClient
+
+from _env import DEV_PASSWORD, bt
+
+
+def login_headers(client: TestClient, role: str) -> dict:
+    response = client.post(
+        "/auth/login",
+        data={"username": f"{role}@sasweb.gov", "password": DEV_PASSWORD},
+    )
+    response.raise_for_status()
+    return {"Authorization": "Bearer " + response.json()["access_token"]}
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(bt.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def auth(client):
+    return {role: login_headers(client, role) for role in ("admin", "issuer", "bidder", "auditor")}
+
+
+@pytest.fixture(scope="session")
+def tender_id(client, auth):
+    """A published tender with a few hundred rows of neighbours to list."""
+    response = client.post(
+        "/tenders/import",
+        files={
+            "file": (
+                "seed.ndjson",
+                "".join(
+                    f'{{"title": "Seed tender {i}", "description": "Road maintenance lot {i}"}}\n'
+                    for i in range(500)
+                ).encode(),
+            )
+        },
+        headers=auth["issuer"],
+    )
+    response.raise_for_status()
+    response = client.post(
+        "/tenders",
+        json={"title": "Benchmark tender", "description": "Hot path", "estimated_budget": 1000000},
+        headers=auth["issuer"],
+    )
+    response.raise_for_status()
+    created = response.json()["id"]
+    client.post(f"/tenders/{created}/publish", json={}, headers=auth["issuer"]).raise_for_status()
+    return created
@@ -0,0 +1,207 @@
+"""Concurrent load scenario against the in-process app.
+
+Drives the hot paths through ``httpx.AsyncClient`` over an ASGI transport
+(no network, temporary SQLite database) with a fixed number of concurrent
+workers per scenario, and reports requests/sec and p50/p99 latency. Results
+are compared with the baseline recorded at the same ``--scale`` in
+``baselines/load.json`` (tail latencies of a short run are not comparable
+with a long one); a scenario regresses when its p50 or p99 grows, or its
+throughput drops, by more than ``--tolerance``. The p99 allowance widens
+for scenarios with fewer than ``STABLE_TAIL_SAMPLES`` requests above it.
+
+    python load_scenario.py                       compare against the baseline
+    python load_scenario.py --save                record a new baseline
+    python load_scenario.py --scale 0.2 --save    baseline for a quicker run
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import statistics
+import time
+
+import httpx
+
+from _env import DEV_PASSWORD, bt
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "load.json")
+DOCUMENT = os.urandom(512 * 1024)
+STABLE_TAIL_SAMPLES = 10
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+async def drive(name: str, requests: int, concurrency: int, send) -> dict:
+    """Run ``send(i)`` ``requests`` times over ``concurrency`` workers."""
+    latencies = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            response = await send(i)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "name": name,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+    }
+
+
+async def run_scenarios(scale: float) -> list:
+    def n(count: int) -> int:
+        return max(10, int(count * scale))
+
+    bt.on_startup()
+    transport = httpx.ASGITransport(app=bt.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def login(role: str) -> dict:
+            response = await client.post(
+                "/auth/login", data={"username": f"{role}@sasweb.gov", "password": DEV_PASSWORD}
+            )
+            response.raise_for_status()
+            return {"Authorization": "Bearer " + response.json()["access_token"]}
+
+        issuer, bidder = await login("issuer"), await login("bidder")
+        response = await client.post(
+            "/tenders", json={"title": "Load tender", "description": "Deadline burst"}, headers=issuer
+        )
+        tender_id = response.json()["id"]
+        await client.post(f"/tenders/{tender_id}/publish", json={}, headers=issuer)
+        response = await client.post(
+            "/documents",
+            files={"file": ("spec.bin", DOCUMENT)},
+            params={"tender_id": tender_id, "visibility": "public"},
+            headers=issuer,
+        )
+        document_id = response.json()["id"]
+
+        form = {"username": "bidder@sasweb.gov", "password": DEV_PASSWORD}
+        scenarios = [
+            ("login", n(200), 8, lambda i: client.post("/auth/login", data=form)),
+            ("current_user", n(3000), 32, lambda i: client.get("/auth/me", headers=bidder)),
+            ("list_tenders", n(3000), 32, lambda i: client.get("/tenders", params={"limit": 50})),
+            (
+                "deadline_burst_direct",
+                n(1000),
+                64,
+                lambda i: client.post(
+                    f"/tenders/{tender_id}/submissions", json={"amount": 1000 + i}, headers=bidder
+                ),
+            ),
+            (
+                "deadline_burst_queued",
+                n(3000),
+                64,
+                lambda i: client.post(
+                    f"/tenders/{tender_id}/submissions/queued", json={"amount": 1000 + i}, headers=bidder
+                ),
+            ),
+            (
+                "document_upload",
+                n(200),
+                8,
+                # Distinct content per request, so each upload stores a new blob.
+                lambda i: client.post(
+                    "/documents",
+                    files={"file": ("spec.bin", i.to_bytes(8, "big") + DOCUMENT)},
+                    params={"tender_id": tender_id},
+                    headers=issuer,
+                ),
+            ),
+            (
+                "document_download",
+                n(1000),
+                16,
+                lambda i: client.get(f"/documents/{document_id}", headers=bidder),
+            ),
+        ]
+        results = []
+        for name, requests, concurrency, send in scenarios:
+            results.append(await drive(name, requests, concurrency, send))
+    await bt.on_shutdown()
+    return results
+
+
+def p99_tolerance(tolerance: float, requests: int) -> float:
+    """Widen ``tolerance`` for a p99 that rests on only a few slow samples."""
+    tail = max(1.0, requests * 0.01)
+    return tolerance * max(1.0, math.sqrt(STABLE_TAIL_SAMPLES / tail))
+
+
+def compare(results: list, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for result in results:
+        base = baseline.get(result["name"])
+        if base is None:
+            continue
+        allowed = {"p50_ms": tolerance, "p99_ms": p99_tolerance(tolerance, result["requests"])}
+        for key, slack in allowed.items():
+            if result[key] > base[key] * (1 + slack):
+                regressions.append(f"{result['name']}: {key} {result[key]} > baseline {base[key]}")
+        if result["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{result['name']}: rps {result['rps']} < baseline {base['rps']}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every request count.")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative slowdown.")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline.")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run_scenarios(args.scale))
+    print(f"{'scenario':24} {'reqs':>6} {'conc':>5} {'err':>4} {'rps':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for r in results:
+        print(
+            f"{r['name']:24} {r['requests']:6} {r['concurrency']:5} {r['errors']:4} "
+            f"{r['rps']:9} {r['p50_ms']:9} {r['p99_ms']:9}"
+        )
+    failed = [r["name"] for r in results if r["errors"]]
+    if failed:
+        print("errors in: " + ", ".join(failed))
+
+    scale = f"{args.scale:g}"
+    baselines = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as fh:
+            baselines = json.load(fh)
+
+    if args.save:
+        baselines[scale] = {r["name"]: r for r in results}
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w") as fh:
+            json.dump(baselines, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+        print(f"baseline for scale {scale} written to {BASELINE_PATH}")
+        return 1 if failed else 0
+
+    if scale not in baselines:
+        print(f"no baseline recorded for scale {scale}; run with --scale {scale} --save")
+        return 1 if failed else 0
+    regressions = compare(results, baselines[scale], args.tolerance)
+    for line in regressions:
+        print("REGRESSION " + line)
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
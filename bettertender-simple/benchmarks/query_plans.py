@@ -0,0 +1,180 @@
+"""Check that the listing queries stay on their indexes as tables grow.
+
+Seeds a throwaway SQLite database through ``migrate_database`` at each size,
+prints SQLite's query plan and median latency for the list endpoints'
+statements, and exits non-zero if any plan scans a table or sorts in a
+temporary B-tree instead of walking a (foreign key, id) index.
+
+    python benchmarks/query_plans.py --sizes 10000 100000 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from sqlalchemy import func, insert, or_, select  # noqa: E402
+
+import bettertender_simple as bt  # noqa: E402
+
+USERS = 1000
+TENDERS = 2000
+INSERT_CHUNK = 20000
+
+
+def list_queries(tender_id: int, user_id: int):
+    """The statements behind the submission and document list routes."""
+    Submission, Document = bt.Submission, bt.Document
+    return {
+        "list_submissions_for_tender": select(Submission)
+        .where(Submission.tender_id == tender_id)
+        .order_by(Submission.id.desc()),
+        "list_my_submissions": select(Submission)
+        .where(Submission.bidder_id == user_id)
+        .order_by(Submission.id.desc()),
+        "list_my_documents": select(Document)
+        .where(Document.owner_id == user_id)
+        .order_by(Document.id.desc()),
+        "list_tender_documents": select(Document)
+        .where(
+            Document.tender_id == tender_id,
+            or_(Document.visibility == "public", Document.owner_id == user_id),
+        )
+        .order_by(Document.id),
+    }
+
+
+def seed(engine, submissions: int) -> None:
+    rng = random.Random(submissions)
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(
+            insert(bt.User),
+            [
+                {
+                    "email": f"user{i}@example.test",
+                    "full_name": f"User {i}",
+                    "hashed_password": "x",
+                    "role": "bidder",
+                    "created_at": now,
+                }
+                for i in range(USERS)
+            ],
+        )
+        conn.execute(
+            insert(bt.Tender),
+            [
+                {
+                    "owner_id": rng.randint(1, USERS),
+                    "title": f"Tender {i}",
+                    "description": "Benchmark tender",
+                    "status": bt.TenderStatus.published,
+                    "created_at": now,
+                }
+                for i in range(TENDERS)
+            ],
+        )
+    for start in range(0, submissions, INSERT_CHUNK):
+        count = min(INSERT_CHUNK, submissions - start)
+        with engine.begin() as conn:
+            conn.execute(
+                insert(bt.Submission),
+                [
+                    {
+                        "tender_id": rng.randint(1, TENDERS),
+                        "bidder_id": rng.randint(1, USERS),
+                        "is_anonymous": False,
+                        "amount": rng.randint(1000, 1000000),
+                        "created_at": now,
+                    }
+                    for _ in range(count)
+                ],
+            )
+            conn.execute(
+                insert(bt.Document.__table__),
+                [
+                    {
+                        "owner_id": rng.randint(1, USERS),
+                        "tender_id": rng.randint(1, TENDERS),
+                        "filename": "spec.pdf",
+                        "storage_path": "/dev/null",
+                        "visibility": rng.choice(["public", "internal"]),
+                        "uploaded_at": now,
+                    }
+                    for _ in range(count // 10)
+                ],
+            )
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+
+def busiest(conn, column) -> int:
+    """The ``column`` value with the most submissions: the longest list to walk."""
+    return conn.execute(
+        select(column).group_by(column).order_by(func.count().desc(), column).limit(1)
+    ).scalar_one()
+
+
+def query_plan(conn, stmt) -> str:
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql).all()
+    return "; ".join(row[-1] for row in rows)
+
+
+def plan_problem(plan: str):
+    if "TEMP B-TREE" in plan:
+        return "sorts in a temporary B-tree"
+    if "SCAN" in plan:
+        return "scans a table"
+    if "USING INDEX" not in plan and "USING COVERING INDEX" not in plan:
+        return "does not use an index"
+    return None
+
+
+def run(sizes, repeats: int) -> int:
+    failures = 0
+    for size in sizes:
+        workdir = tempfile.mkdtemp(prefix="bt-bench-")
+        engine = bt.build_engine(f"sqlite:///{workdir}/bench.db")
+        bt.migrate_database(engine)
+        started = time.perf_counter()
+        seed(engine, size)
+        print(f"\n== {size:,} submissions (seeded in {time.perf_counter() - started:.1f}s)")
+        with engine.connect() as conn:
+            tender_id = busiest(conn, bt.Submission.tender_id)
+            user_id = busiest(conn, bt.Submission.bidder_id)
+            print(f"busiest tender {tender_id}, busiest bidder {user_id}")
+            for name, stmt in list_queries(tender_id=tender_id, user_id=user_id).items():
+                plan = query_plan(conn, stmt)
+                timings = []
+                for _ in range(repeats):
+                    t0 = time.perf_counter()
+                    rows = conn.execute(stmt).all()
+                    timings.append(time.perf_counter() - t0)
+                problem = plan_problem(plan)
+                failures += problem is not None
+                print(
+                    f"{name:30} {len(rows):6} rows  "
+                    f"median {statistics.median(timings) * 1000:7.2f} ms  "
+                    f"{'FAIL: ' + problem if problem else 'ok'}"
+                )
+                print(f"    {plan}")
+        engine.dispose()
+    return 1 if failures else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 500000])
+    parser.add_argument("--repeats", type=int, default=25)
+    args = parser.parse_args(argv)
+    return run(args.sizes, args.repeats)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
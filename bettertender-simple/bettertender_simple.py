@@ -1,16 +1,46 @@
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Iterator
+from datetime import datetime, timedelta, timezone
+import asyncio
+import contextvars
+import csv
+import gzip
 import hashlib
+import io
+import heapq
+import hmac
+import itertools
+import json
+import logging
 import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager, suppress
+from urllib.parse import quote
 from enum import Enum
 
-from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, Form
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, run a single worker there
+    fcntl = None
+
+from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, Form, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from jose import jwt, JWTError
 from passlib.context import CryptContext
-from pydantic import BaseModel, EmailStr, ConfigDict
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from pydantic import BaseModel, EmailStr, ConfigDict, TypeAdapter, ValidationError
 from sqlalchemy import (
     create_engine,
     Column,
@@ -23,53 +53,429 @@ from sqlalchemy import (
     ForeignKey,
     JSON,
     Float,
+    Index,
+    case,
+    column,
+    event,
+    func,
+    insert,
+    inspect,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    update,
 )
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, relationship, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 # ------------ Basic config ------------
 
-DATABASE_URL = "sqlite:///./bettertender_simple.db"
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./bettertender_simple.db")
+if DATABASE_URL.startswith("postgres://"):
+    # Render/Heroku hand out the legacy scheme, which SQLAlchemy 2 rejects.
+    DATABASE_URL = "postgresql://" + DATABASE_URL[len("postgres://"):]
 SECRET_KEY = "CHANGE_ME_IN_PROD"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
-connect_args = {"check_same_thread": False}
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+
+def build_engine(url: str):
+    """Create the engine for ``url`` with pooling suited to its backend.
+
+    SQLite runs in WAL mode with ``synchronous=NORMAL`` and a busy timeout so
+    readers never block the writer and concurrent writers wait rather than
+    fail. Server databases get a sized, pre-pinged, recycled connection pool
+    and sessions pinned to UTC.
+    """
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        database = make_url(url).database
+        in_memory = database in (None, "", ":memory:")
+        kwargs: Dict[str, Any] = {
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+            }
+        }
+        if in_memory:
+            kwargs["poolclass"] = StaticPool
+        else:
+            kwargs.update(
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+            )
+        sqlite_engine = create_engine(url, **kwargs)
+
+        @event.listens_for(sqlite_engine, "connect")
+        def _configure_sqlite(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            if not in_memory:
+                cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            cursor.close()
+
+        return sqlite_engine
+
+    connect_args: Dict[str, Any] = {}
+    if backend == "postgresql":
+        connect_args["options"] = "-c timezone=utc"
+    return create_engine(
+        url,
+        connect_args=connect_args,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
+
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}.get(backend)
+    if driver is None:
+        return url
+    return parsed.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+def build_async_engine(url: str):
+    """Async counterpart of ``build_engine`` (aiosqlite / asyncpg).
+
+    Both engines must point at the same database, so an in-memory SQLite URL
+    is not supported here.
+    """
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        sqlite_engine = create_async_engine(
+            url,
+            connect_args={"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+        )
+
+        @event.listens_for(sqlite_engine.sync_engine, "connect")
+        def _configure_sqlite(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            cursor.close()
+
+        return sqlite_engine
+
+    connect_args: Dict[str, Any] = {}
+    if backend == "postgresql":
+        connect_args["server_settings"] = {"timezone": "utc"}
+    return create_async_engine(
+        url,
+        connect_args=connect_args,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+engine = build_engine(DATABASE_URL)
+async_engine = build_async_engine(ASYNC_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Changing PASSWORD_HASH_ROUNDS makes existing hashes "need update"; they are
+# transparently rehashed on the user's next successful login.
+PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", "29000"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+PASSWORD_HASH_TIMEOUT_SECONDS = float(os.getenv("PASSWORD_HASH_TIMEOUT_SECONDS", "10"))
+
+logger = logging.getLogger("bettertender")
+
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__default_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__max_rounds=PASSWORD_HASH_ROUNDS,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
 
 
 def get_db():
-    db = SessionLocal()
+    # Sync routes serialize their response on the threadpool after returning;
+    # keeping committed objects loaded means no connection is checked out
+    # again (and held) while that serialization waits for a thread.
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
         db.close()
 
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# ------------ Metrics ------------
+
+# Own registry rather than the global one, so importing the module twice
+# (tests, benchmarks) does not trip over duplicate collectors. Metrics are
+# per process; with several workers, scrape each one.
+metrics_registry = CollectorRegistry(auto_describe=True)
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time until the response starts, by route template.",
+    ["method", "route", "status"],
+    buckets=_LATENCY_BUCKETS,
+    registry=metrics_registry,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests currently being handled.",
+    registry=metrics_registry,
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database statements executed per request.",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+    registry=metrics_registry,
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing database statements per request.",
+    ["method", "route"],
+    buckets=_LATENCY_BUCKETS,
+    registry=metrics_registry,
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "Duration of individual database statements.",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+    registry=metrics_registry,
+)
+AUDIT_APPEND_SECONDS = Histogram(
+    "audit_append_duration_seconds",
+    "Time to get audit entries committed, including waiting for the chain lock.",
+    ["mode"],
+    buckets=_LATENCY_BUCKETS,
+    registry=metrics_registry,
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying a password on the hashing pool.",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    registry=metrics_registry,
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected",
+    "Hashing requests refused because the pool was saturated.",
+    registry=metrics_registry,
+)
+UPLOAD_BYTES = Counter(
+    "document_upload_bytes",
+    "Bytes of document content received.",
+    registry=metrics_registry,
+)
+UPLOAD_BYTES_PER_SECOND = Histogram(
+    "document_upload_bytes_per_second",
+    "Per-upload throughput of hashing and storing the received file.",
+    buckets=(1e6, 5e6, 1e7, 5e7, 1e8, 2.5e8, 5e8, 1e9),
+    registry=metrics_registry,
+)
+
+# [statement count, seconds] for the request being handled, if any. Worker
+# threads started by the request inherit the context and share the list.
+_request_db_usage: contextvars.ContextVar = contextvars.ContextVar("request_db_usage", default=None)
+
+
+def _instrument_engine(sync_engine, name: str) -> None:
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        DB_QUERY_SECONDS.labels(name).observe(elapsed)
+        usage = _request_db_usage.get()
+        if usage is not None:
+            usage[0] += 1
+            usage[1] += elapsed
+
+    # Statements that raise never reach after_cursor_execute.
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(context):
+        started = context.connection.info.get("query_started") if context.connection else None
+        if started:
+            started.pop()
+
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool.",
+    ["engine"],
+    registry=metrics_registry,
+)
+DB_POOL_SATURATION = Gauge(
+    "db_pool_saturation",
+    "Checked-out connections as a fraction of pool size plus max overflow.",
+    ["engine"],
+    registry=metrics_registry,
+)
+
+
+def _register_pool_gauges(pool, name: str) -> None:
+    # StaticPool and NullPool keep no size accounting; only queue pools report.
+    if not hasattr(pool, "checkedout"):
+        return
+    capacity = pool.size() + max(DB_MAX_OVERFLOW, 0)
+    DB_POOL_CHECKED_OUT.labels(name).set_function(pool.checkedout)
+    DB_POOL_SATURATION.labels(name).set_function(
+        lambda: pool.checkedout() / capacity if capacity else 0.0
+    )
+
+
+_instrument_engine(engine, "sync")
+_instrument_engine(async_engine.sync_engine, "async")
+_register_pool_gauges(engine.pool, "sync")
+_register_pool_gauges(async_engine.sync_engine.pool, "async")
+
 # ------------ Security helpers ------------
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+class PasswordHasher:
+    """Runs password hashing on a dedicated, bounded thread pool.
+
+    PBKDF2 is CPU-bound, so a small pool caps how many request threads can be
+    burning CPU on it at once. When ``max_pending`` operations are already
+    queued or running, new ones are rejected with 503 instead of piling up.
+    """
+
+    def __init__(self, context: CryptContext, workers: int, max_pending: int, timeout: float):
+        self._context = context
+        self._timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._stats_lock = threading.Lock()
+        self._durations: "deque[float]" = deque(maxlen=1024)
+        self._count = 0
+        self._total_seconds = 0.0
+        self._rejected = 0
+
+    def _timed(self, operation: str, fn, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            PASSWORD_HASH_SECONDS.labels(operation).observe(elapsed)
+            with self._stats_lock:
+                self._count += 1
+                self._total_seconds += elapsed
+                self._durations.append(elapsed)
+
+    def _run(self, operation: str, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            PASSWORD_HASH_REJECTED.inc()
+            with self._stats_lock:
+                self._rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service busy, please retry.",
+                headers={"Retry-After": "1"},
+            )
+        future = self._pool.submit(self._timed, operation, fn, *args)
+        # The slot is held until the work actually finishes, even if we stop
+        # waiting for it.
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self._timeout)
+        except FutureTimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service busy, please retry.",
+                headers={"Retry-After": "1"},
+            )
+
+    def hash(self, password: str) -> str:
+        return self._run("hash", self._context.hash, password)
+
+    def verify_and_update(self, password: str, hashed: str):
+        """Return ``(valid, new_hash)``; ``new_hash`` is set when parameters changed."""
+        return self._run("verify", self._context.verify_and_update, password, hashed)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            durations = sorted(self._durations)
+            count, total, rejected = self._count, self._total_seconds, self._rejected
+
+        def pct(q: float) -> Optional[float]:
+            if not durations:
+                return None
+            return round(durations[min(len(durations) - 1, int(q * len(durations)))] * 1000, 2)
+
+        return {
+            "count": count,
+            "rejected": rejected,
+            "mean_ms": round(total / count * 1000, 2) if count else None,
+            "p50_ms": pct(0.50),
+            "p99_ms": pct(0.99),
+        }
+
+
+password_hasher = PasswordHasher(
+    pwd_context,
+    workers=PASSWORD_HASH_WORKERS,
+    max_pending=PASSWORD_HASH_MAX_PENDING,
+    timeout=PASSWORD_HASH_TIMEOUT_SECONDS,
+)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+def hash_password(password: str) -> str:
+    return password_hasher.hash(password)
 
 
-def create_access_token(subject: str, expires_minutes: int = None) -> str:
+def create_access_token(
+    subject: str,
+    expires_minutes: int = None,
+    user_id: Optional[int] = None,
+) -> str:
     if expires_minutes is None:
         expires_minutes = ACCESS_TOKEN_EXPIRE_MINUTES
     expire = datetime.utcnow() + timedelta(minutes=expires_minutes)
     to_encode = {"sub": subject, "exp": expire}
+    if user_id is not None:
+        to_encode["uid"] = user_id
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def decode_token(token: str) -> Optional[str]:
+def decode_token_claims(token: str) -> Optional[Dict[str, Any]]:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload.get("sub")
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         return None
 
@@ -110,6 +516,11 @@ class TenderStatus(str, Enum):
 
 class Tender(Base):
     __tablename__ = "tenders"
+    __table_args__ = (
+        Index("ix_tenders_status_id", "status", "id"),
+        Index("ix_tenders_owner_id_id", "owner_id", "id"),
+        Index("ix_tenders_close_at", "close_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -123,14 +534,23 @@ class Tender(Base):
 
 class Submission(Base):
     __tablename__ = "submissions"
+    __table_args__ = (
+        Index("ix_submissions_tender_id_id", "tender_id", "id"),
+        Index("ix_submissions_bidder_id_id", "bidder_id", "id"),
+        Index("ux_submissions_receipt_id", "receipt_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     tender_id = Column(Integer, ForeignKey("tenders.id"), nullable=False)
     bidder_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # null if anonymous
     is_anonymous = Column(Boolean, default=False, nullable=False)
+    anonymous_commitment = Column(String(64), nullable=True)
+    anonymous_nonce_hint = Column(String(16), nullable=True)
+    encrypted_payload = Column(Text, nullable=True)
     amount = Column(Float, nullable=True)
     notes = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    receipt_id = Column(String(32), nullable=True)  # set for journaled bids
 
     # supplier info
     company_name = Column(String, nullable=True)
@@ -142,6 +562,21 @@ class Submission(Base):
     bidder = relationship("User")
     tender = relationship("Tender", backref="submissions")
 
+
+class TenderStats(Base):
+    """Running submission aggregates per tender, kept in step with inserts."""
+
+    __tablename__ = "tender_stats"
+
+    tender_id = Column(Integer, ForeignKey("tenders.id"), primary_key=True)
+    submission_count = Column(Integer, default=0, nullable=False)
+    anonymous_count = Column(Integer, default=0, nullable=False)
+    priced_count = Column(Integer, default=0, nullable=False)
+    amount_sum = Column(Float, default=0.0, nullable=False)
+    amount_min = Column(Float, nullable=True)
+    amount_max = Column(Float, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
 from pathlib import Path
 import os
 
@@ -152,21 +587,45 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 
 class Document(Base):
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_owner_id_id", "owner_id", "id"),
+        Index("ix_documents_tender_id_id", "tender_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     tender_id = Column(Integer, ForeignKey("tenders.id"), nullable=True)
-    filename = Column(String, nullable=False)
-    storage_path = Column(String, nullable=False)
+    original_filename = Column("filename", String, nullable=False)
+    stored_path = Column("storage_path", String, nullable=False)
+    mime_type = Column(String(255), nullable=True)
+    checksum = Column(String(64), nullable=True, index=True)
     visibility = Column(String, default="internal", nullable=False)  # public/internal/restricted
-    uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column("uploaded_at", DateTime, default=datetime.utcnow, nullable=False)
 
     owner = relationship("User", backref="documents")
     tender = relationship("Tender", backref="documents")
 
 
+class DocumentBlob(Base):
+    """One stored file per distinct content checksum, shared by documents."""
+
+    __tablename__ = "document_blobs"
+
+    checksum = Column(String(64), primary_key=True)
+    storage_path = Column(String, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_actor_id_id", "actor_id", "id"),
+        Index("ix_audit_logs_action_id", "action", "id"),
+        Index("ix_audit_logs_resource_id", "resource_type", "resource_id", "id"),
+        Index("ix_audit_logs_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     actor_id = Column(Integer, nullable=True, index=True)
@@ -177,6 +636,37 @@ class AuditLog(Base):
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     immutable_signature = Column(String(128), nullable=False, index=True)
 
+
+class AuditCheckpoint(Base):
+    __tablename__ = "audit_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    audit_log_id = Column(Integer, nullable=False, index=True)
+    immutable_signature = Column(String(128), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+class AuditChainHead(Base):
+    """Single row (id 1) holding the latest audit signature.
+
+    Every audited transaction updates this row first, which serializes chain
+    appends across processes as well as threads.
+    """
+
+    __tablename__ = "audit_chain_head"
+
+    id = Column(Integer, primary_key=True)
+    audit_log_id = Column(Integer, nullable=True)
+    immutable_signature = Column(String(128), nullable=True)
+
+
+class SchemaMigration(Base):
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True)
+    description = Column(String(255), nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
 # ------------ Pydantic schemas ------------
 
 class UserCreate(BaseModel):
@@ -221,6 +711,9 @@ class TenderUpdate(BaseModel):
 
 class TenderPublishRequest(BaseModel):
     close_at: Optional[datetime] = None
+    # When in the future the tender stays a draft until the scheduler
+    # publishes it at this time.
+    publish_at: Optional[datetime] = None
 
 
 class TenderAwardRequest(BaseModel):
@@ -238,12 +731,74 @@ class TenderRead(TenderBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TenderSummary(BaseModel):
+    id: int
+    owner_id: int
+    title: str
+    estimated_budget: Optional[int]
+    status: TenderStatus
+    created_at: datetime
+    publish_at: Optional[datetime]
+    close_at: Optional[datetime]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TenderSearchHit(TenderSummary):
+    snippet: str
+    score: float
+
+
+class TenderImportError(BaseModel):
+    line: int
+    error: str
+
+
+class TenderImportResult(BaseModel):
+    imported: int
+    rejected: int
+    batches: int
+    first_id: Optional[int] = None
+    last_id: Optional[int] = None
+    errors: List[TenderImportError]
+
+
+class TenderStatsRead(BaseModel):
+    tender_id: int
+    submission_count: int = 0
+    anonymous_count: int = 0
+    named_count: int = 0
+    priced_count: int = 0
+    amount_min: Optional[float] = None
+    amount_max: Optional[float] = None
+    amount_mean: Optional[float] = None
+    updated_at: Optional[datetime] = None
+
+
+class TenderReadWithStats(TenderRead):
+    submission_count: int = 0
+
+
+class TenderSummaryWithStats(TenderSummary):
+    submission_count: int = 0
+
+
+class TenderView(str, Enum):
+    full = "full"
+    summary = "summary"
+
+
 class SubmissionBase(BaseModel):
     amount: Optional[int] = None
     notes: Optional[str] = None
     is_anonymous: bool = False
     payload: Optional[str] = None
     nonce: Optional[str] = None
+    company_name: Optional[str] = None
+    bbbee_level: Optional[str] = None
+    years_in_service: Optional[int] = None
+    tax_number: Optional[str] = None
+    csd_number: Optional[str] = None
 
 
 class SubmissionCreate(SubmissionBase):
@@ -259,10 +814,80 @@ class SubmissionRead(BaseModel):
     amount: Optional[int]
     notes: Optional[str]
     created_at: datetime
+    company_name: Optional[str] = None
+    bbbee_level: Optional[str] = None
+    years_in_service: Optional[int] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class SubmissionReceipt(BaseModel):
+    receipt_id: str
+    tender_id: int
+    received_at: datetime
+    commitment: str
+    status: str = "queued"
+
+
+class SubmissionReceiptStatus(BaseModel):
+    receipt_id: str
+    status: str
+    submission_id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class RevealItem(BaseModel):
+    submission_id: int
+    payload: str
+    nonce: str
+
+
+class RevealRequest(BaseModel):
+    items: List[RevealItem]
+
+
+class RevealResult(BaseModel):
+    submission_id: int
+    status: str  # verified | mismatch | not_found | not_sealed
+    amount: Optional[int] = None
+
+
+class RevealResponse(BaseModel):
+    tender_id: int
+    verified: int
+    rejected: int
+    results: List[RevealResult]
+
+
+class PreferenceSystem(str, Enum):
+    auto = "auto"
+    p80_20 = "80/20"
+    p90_10 = "90/10"
+
+
+class RankedSubmission(BaseModel):
+    rank: int
+    submission_id: int
+    bidder_id: Optional[int]
+    is_anonymous: bool
+    company_name: Optional[str]
+    amount: float
+    bbbee_level: Optional[int]
+    years_in_service: Optional[int]
+    price_points: float
+    preference_points: float
+    total_points: float
+
+
+class TenderRanking(BaseModel):
+    tender_id: int
+    system: PreferenceSystem
+    lowest_amount: Optional[float]
+    ranked_count: int
+    unpriced_count: int
+    results: List[RankedSubmission]
+
+
 class DocumentRead(BaseModel):
     id: int
     owner_id: Optional[int]
@@ -289,6 +914,14 @@ class AuditLogRead(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+
+class AuditVerifyRead(BaseModel):
+    ok: bool
+    rows_checked: int
+    started_after_id: int
+    last_verified_id: int
+    first_invalid_id: Optional[int] = None
+
 # ------------ Audit helper ------------
 
 def _compute_signature(
@@ -302,6 +935,10 @@ def _compute_signature(
 ) -> str:
     import json
     payload_json = json.dumps(payload or {}, sort_keys=True, separators=(",", ":"))
+    if created_at.tzinfo is not None:
+        # Backends with real timestamptz hand values back as aware UTC;
+        # signatures are always computed over the naive UTC form.
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
     base = "|".join(
         [
             prev_signature or "GENESIS",
@@ -316,6 +953,254 @@ def _compute_signature(
     return hashlib.sha256(base.encode("utf-8")).hexdigest()
 
 
+def _audit_snapshot(entry: AuditLog) -> Dict[str, Any]:
+    return {
+        "id": entry.id,
+        "actor_id": entry.actor_id,
+        "action": entry.action,
+        "resource_type": entry.resource_type,
+        "resource_id": entry.resource_id,
+        "payload": entry.payload,
+        "created_at": entry.created_at,
+        "immutable_signature": entry.immutable_signature,
+    }
+
+
+def seed_audit_chain_head(conn) -> None:
+    """Create the head row from the current tail of ``audit_logs`` if missing."""
+    if conn.scalar(select(AuditChainHead.id).where(AuditChainHead.id == 1)) is not None:
+        return
+    last = conn.execute(
+        select(AuditLog.id, AuditLog.immutable_signature).order_by(AuditLog.id.desc()).limit(1)
+    ).first()
+    conn.execute(
+        insert(AuditChainHead).values(
+            id=1,
+            audit_log_id=last[0] if last else None,
+            immutable_signature=last[1] if last else None,
+        )
+    )
+
+
+class _PendingAudit:
+    __slots__ = ("fields", "entry", "error", "done")
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+        self.entry: Optional[AuditLog] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+
+class AuditChainWriter:
+    """Single writer for the audit hash chain.
+
+    Each audited transaction starts by updating the ``audit_chain_head`` row,
+    which holds the database's write lock (SQLite) or the row lock (other
+    backends) until commit, then reads the head signature from it. Appends are
+    therefore serialized across worker processes, and the chain stays linear
+    however many workers share the database. Within a process a lock queues
+    callers up, and callers that arrive while another append is committing
+    are group-committed by whichever caller takes the lock next.
+
+    Callers check out their connection before waiting for the lock, and the
+    lock holder writes on its own session, so no connection is ever requested
+    while the lock is held.
+
+    Listeners registered with ``add_listener`` receive snapshots of every
+    committed batch, after the write lock is released.
+    """
+
+    def __init__(self, max_batch: int = 500):
+        self._max_batch = max_batch
+        self._write_lock = threading.Lock()
+        self._queue_lock = threading.Lock()
+        self._queue: List[_PendingAudit] = []
+        self._head: Optional[str] = None
+        self._listeners: List[Any] = []
+
+    def add_listener(self, listener) -> None:
+        """Call ``listener(entries)`` with dict snapshots of each committed batch."""
+        self._listeners.append(listener)
+
+    def _notify(self, snapshots: List[Dict[str, Any]]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(snapshots)
+            except Exception:
+                logger.exception("Audit listener failed")
+
+    def _lock_head(self, db: Session) -> None:
+        """Lock the head row for ``db``'s transaction and load the head from it."""
+        locked = db.execute(
+            update(AuditChainHead)
+            .where(AuditChainHead.id == 1)
+            .values(audit_log_id=AuditChainHead.audit_log_id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not locked:
+            seed_audit_chain_head(db)
+        self._head = db.execute(
+            select(AuditChainHead.immutable_signature).where(AuditChainHead.id == 1)
+        ).scalar()
+
+    def _store_head(self, db: Session, entry: AuditLog) -> None:
+        db.execute(
+            update(AuditChainHead)
+            .where(AuditChainHead.id == 1)
+            .values(audit_log_id=entry.id, immutable_signature=entry.immutable_signature)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _chain(self, fields: Dict[str, Any]) -> AuditLog:
+        created_at = datetime.utcnow()
+        sig = _compute_signature(
+            prev_signature=self._head,
+            actor_id=fields["actor_id"],
+            action=fields["action"],
+            resource_type=fields["resource_type"],
+            resource_id=fields["resource_id"],
+            created_at=created_at,
+            payload=fields["payload"],
+        )
+        self._head = sig
+        return AuditLog(
+            actor_id=fields["actor_id"],
+            action=fields["action"],
+            resource_type=fields["resource_type"],
+            resource_id=fields["resource_id"],
+            payload=fields["payload"] or {},
+            created_at=created_at,
+            immutable_signature=sig,
+        )
+
+    def _write_batch(self, db: Session, batch: List[_PendingAudit]) -> List[AuditLog]:
+        entries: List[AuditLog] = []
+        try:
+            self._lock_head(db)
+            entries = [self._chain(pending.fields) for pending in batch]
+            db.add_all(entries)
+            db.flush()
+            self._store_head(db, entries[-1])
+            # Detach before committing so the entries stay readable by the
+            # other waiters instead of being expired with ``db``.
+            for entry in entries:
+                db.expunge(entry)
+            db.commit()
+            for pending, entry in zip(batch, entries):
+                pending.entry = entry
+        except Exception as exc:
+            db.rollback()
+            for pending in batch:
+                pending.error = exc
+            entries = []
+        finally:
+            for pending in batch:
+                pending.done = True
+        return entries
+
+    def append(
+        self,
+        db: Session,
+        actor_id: Optional[int],
+        action: str,
+        resource_type: str,
+        resource_id: Optional[str] = None,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> AuditLog:
+        """Append one entry, committing it on ``db`` or in another caller's batch.
+
+        ``db`` must not hold uncommitted changes: if this caller ends up
+        writing the batch, they are committed along with it.
+        """
+        pending = _PendingAudit(
+            {
+                "actor_id": actor_id,
+                "action": action,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "payload": payload,
+            }
+        )
+        started = time.perf_counter()
+        db.connection()
+        with self._queue_lock:
+            self._queue.append(pending)
+        written: List[AuditLog] = []
+        with self._write_lock:
+            # An earlier lock holder may already have committed our entry.
+            while not pending.done:
+                with self._queue_lock:
+                    batch = self._queue[: self._max_batch]
+                    del self._queue[: self._max_batch]
+                written.extend(self._write_batch(db, batch))
+        # Ends the transaction opened above when another caller wrote our
+        # entry, returning the connection to the pool.
+        db.commit()
+        AUDIT_APPEND_SECONDS.labels("group_commit").observe(time.perf_counter() - started)
+        if written and self._listeners:
+            self._notify([_audit_snapshot(entry) for entry in written])
+        if pending.error is not None:
+            raise pending.error
+        return pending.entry
+
+    @contextmanager
+    def unit_of_work(self, db: Session):
+        """Commit the pending changes in ``db`` together with their audit rows.
+
+        The head row is locked first, then pending domain changes are flushed
+        so generated ids are available; entries passed to the yielded
+        ``record`` callable are chained and added to the same session, and
+        everything is committed in a single transaction when the block exits.
+        On any error the session is rolled back, which also releases the head.
+        """
+        recorded: List[AuditLog] = []
+        snapshots: List[Dict[str, Any]] = []
+        started = time.perf_counter()
+        db.connection()
+        with self._write_lock:
+
+            def record(
+                actor_id: Optional[int],
+                action: str,
+                resource_type: str,
+                resource_id: Optional[str] = None,
+                payload: Optional[Dict[str, Any]] = None,
+            ) -> AuditLog:
+                entry = self._chain(
+                    {
+                        "actor_id": actor_id,
+                        "action": action,
+                        "resource_type": resource_type,
+                        "resource_id": resource_id,
+                        "payload": payload,
+                    },
+                )
+                db.add(entry)
+                recorded.append(entry)
+                return entry
+
+            try:
+                self._lock_head(db)
+                db.flush()
+                yield record
+                db.flush()
+                if recorded:
+                    self._store_head(db, recorded[-1])
+                if self._listeners:
+                    snapshots = [_audit_snapshot(entry) for entry in recorded]
+                db.commit()
+            except BaseException:
+                db.rollback()
+                raise
+        AUDIT_APPEND_SECONDS.labels("unit_of_work").observe(time.perf_counter() - started)
+        if snapshots and self._listeners:
+            self._notify(snapshots)
+
+
+audit_chain = AuditChainWriter()
+
+
 def audit_log(
     db: Session,
     actor_id: Optional[int],
@@ -324,31 +1209,107 @@ def audit_log(
     resource_id: Optional[str] = None,
     payload: Optional[Dict[str, Any]] = None,
 ) -> AuditLog:
-    created_at = datetime.utcnow()
-    last = db.query(AuditLog).order_by(AuditLog.id.desc()).first()
-    prev_sig = last.immutable_signature if last else None
-    sig = _compute_signature(
-        prev_signature=prev_sig,
+    # For events with no accompanying domain change; entries from concurrent
+    # requests are batched into one commit on whichever session gets there
+    # first. Routes that change data use ``audit_chain.unit_of_work(db)``.
+    return audit_chain.append(
+        db,
         actor_id=actor_id,
         action=action,
         resource_type=resource_type,
         resource_id=resource_id,
-        created_at=created_at,
         payload=payload,
     )
-    entry = AuditLog(
-        actor_id=actor_id,
-        action=action,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        payload=payload or {},
-        created_at=created_at,
-        immutable_signature=sig,
-    )
-    db.add(entry)
-    db.commit()
-    db.refresh(entry)
-    return entry
+
+
+AUDIT_VERIFY_FETCH_SIZE = 1000
+AUDIT_CHECKPOINT_INTERVAL = 10000
+
+
+def verify_audit_chain(db: Session, full: bool = False) -> AuditVerifyRead:
+    """Rehash the audit chain, starting from the latest checkpoint unless ``full``.
+
+    Rows are streamed in id order with a server-side cursor, one checkpoint
+    interval at a time, and a checkpoint is committed after every interval so
+    the next run only rehashes rows appended since.
+    """
+    checkpoint = None
+    if not full:
+        checkpoint = (
+            db.query(AuditCheckpoint)
+            .order_by(AuditCheckpoint.audit_log_id.desc())
+            .first()
+        )
+    start_id = checkpoint.audit_log_id if checkpoint else 0
+    last_id = start_id
+    prev_sig = checkpoint.immutable_signature if checkpoint else None
+    rows_checked = 0
+
+    def result(first_invalid_id: Optional[int] = None) -> AuditVerifyRead:
+        return AuditVerifyRead(
+            ok=first_invalid_id is None,
+            rows_checked=rows_checked,
+            started_after_id=start_id,
+            last_verified_id=last_id,
+            first_invalid_id=first_invalid_id,
+        )
+
+    if checkpoint is not None:
+        stored_sig = (
+            db.query(AuditLog.immutable_signature)
+            .filter(AuditLog.id == checkpoint.audit_log_id)
+            .scalar()
+        )
+        if stored_sig != checkpoint.immutable_signature:
+            return result(first_invalid_id=checkpoint.audit_log_id)
+
+    while True:
+        stmt = (
+            select(
+                AuditLog.id,
+                AuditLog.actor_id,
+                AuditLog.action,
+                AuditLog.resource_type,
+                AuditLog.resource_id,
+                AuditLog.created_at,
+                AuditLog.payload,
+                AuditLog.immutable_signature,
+            )
+            .where(AuditLog.id > last_id)
+            .order_by(AuditLog.id)
+            .limit(AUDIT_CHECKPOINT_INTERVAL)
+            .execution_options(stream_results=True, yield_per=AUDIT_VERIFY_FETCH_SIZE)
+        )
+        seen = 0
+        rows = db.execute(stmt)
+        try:
+            for row in rows:
+                expected = _compute_signature(
+                    prev_signature=prev_sig,
+                    actor_id=row.actor_id,
+                    action=row.action,
+                    resource_type=row.resource_type,
+                    resource_id=row.resource_id,
+                    created_at=row.created_at,
+                    payload=row.payload,
+                )
+                if expected != row.immutable_signature:
+                    return result(first_invalid_id=row.id)
+                prev_sig = row.immutable_signature
+                last_id = row.id
+                seen += 1
+                rows_checked += 1
+        finally:
+            rows.close()
+
+        if seen == 0:
+            break
+        db.add(AuditCheckpoint(audit_log_id=last_id, immutable_signature=prev_sig))
+        db.commit()
+        if seen < AUDIT_CHECKPOINT_INTERVAL:
+            break
+
+    return result()
 
 # ------------ RBAC helpers ------------
 
@@ -367,6 +1328,117 @@ def require_owner_or_admin(user: User, owner_id: int) -> None:
             detail="Not allowed to modify this resource.",
         )
 
+# ------------ Schema migrations ------------
+
+def _add_columns(conn, model, names: List[str]) -> None:
+    """Add the model's columns ``names`` to an existing table if they are missing."""
+    table_name = model.__tablename__
+    existing = {col["name"] for col in inspect(conn).get_columns(table_name)}
+    quote = conn.dialect.identifier_preparer.quote
+    for name in names:
+        if name in existing:
+            continue
+        col = model.__table__.c[name]
+        conn.execute(
+            text(
+                f"ALTER TABLE {quote(table_name)} ADD COLUMN {quote(col.name)} "
+                f"{col.type.compile(dialect=conn.dialect)}"
+            )
+        )
+
+
+def _create_indexes(conn, model, names: List[str]) -> None:
+    indexes = {index.name: index for index in model.__table__.indexes}
+    for name in names:
+        indexes[name].create(conn, checkfirst=True)
+
+
+# (version, description, upgrade). Steps check before changing anything, so a
+# database created by create_all() from the current models passes through
+# them untouched; append new steps, never edit applied ones.
+MIGRATIONS = [
+    (
+        1,
+        "sealed-bid columns on submissions",
+        lambda conn: _add_columns(
+            conn, Submission, ["anonymous_commitment", "anonymous_nonce_hint", "encrypted_payload"]
+        ),
+    ),
+    (
+        2,
+        "document metadata and checksums",
+        lambda conn: (
+            _add_columns(conn, Document, ["mime_type", "checksum"]),
+            _create_indexes(conn, Document, ["ix_documents_checksum"]),
+        ),
+    ),
+    (
+        3,
+        "tender and audit log listing indexes",
+        lambda conn: (
+            _create_indexes(
+                conn, Tender, ["ix_tenders_status_id", "ix_tenders_owner_id_id", "ix_tenders_close_at"]
+            ),
+            _create_indexes(
+                conn,
+                AuditLog,
+                [
+                    "ix_audit_logs_actor_id_id",
+                    "ix_audit_logs_action_id",
+                    "ix_audit_logs_resource_id",
+                    "ix_audit_logs_created_at_id",
+                ],
+            ),
+        ),
+    ),
+    (
+        4,
+        "submission receipt ids",
+        lambda conn: (
+            _add_columns(conn, Submission, ["receipt_id"]),
+            _create_indexes(conn, Submission, ["ux_submissions_receipt_id"]),
+        ),
+    ),
+    (
+        5,
+        "foreign key listing indexes",
+        lambda conn: (
+            _create_indexes(
+                conn, Submission, ["ix_submissions_tender_id_id", "ix_submissions_bidder_id_id"]
+            ),
+            _create_indexes(conn, Document, ["ix_documents_owner_id_id", "ix_documents_tender_id_id"]),
+        ),
+    ),
+    (6, "audit chain head row", seed_audit_chain_head),
+]
+
+
+def migrate_database(bind=None) -> List[int]:
+    """Create missing tables, then apply pending ``MIGRATIONS`` in order.
+
+    Each step runs in its own transaction together with its
+    ``schema_migrations`` row. Returns the versions applied by this call.
+    """
+    bind = bind or engine
+    Base.metadata.create_all(bind=bind)
+    applied: List[int] = []
+    with bind.connect() as conn:
+        done = set(conn.scalars(select(SchemaMigration.version)))
+    for version, description, upgrade in MIGRATIONS:
+        if version in done:
+            continue
+        with bind.begin() as conn:
+            upgrade(conn)
+            conn.execute(
+                insert(SchemaMigration).values(
+                    version=version, description=description, applied_at=datetime.utcnow()
+                )
+            )
+        logger.info("Applied schema migration %s: %s", version, description)
+        applied.append(version)
+    return applied
+
+
 # ------------ FastAPI app ------------
 
 app = FastAPI(
@@ -382,17 +1454,95 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 BASE_UPLOAD_DIR = os.path.join(os.getcwd(), "uploads", "documents")
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(100 * 1024 * 1024)))
 
 
 def ensure_upload_dir() -> None:
     os.makedirs(BASE_UPLOAD_DIR, exist_ok=True)
 
+
+@app.middleware("http")
+async def reject_oversized_uploads(request: Request, call_next):
+    # Refuse oversized uploads from Content-Length before the multipart body
+    # is read and spooled; bodies without a length are capped while streaming.
+    if request.method == "POST" and request.url.path == "/documents":
+        length = request.headers.get("content-length")
+        if length and length.isdigit() and int(length) > MAX_UPLOAD_BYTES + 64 * 1024:
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={"detail": f"Uploads are limited to {MAX_UPLOAD_BYTES} bytes."},
+            )
+    return await call_next(request)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    # Registered after the upload guard, so it wraps it and also times 413s.
+    usage = [0, 0.0]
+    token = _request_db_usage.set(usage)
+    HTTP_REQUESTS_IN_PROGRESS.inc()
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - started
+        HTTP_REQUESTS_IN_PROGRESS.dec()
+        _request_db_usage.reset(token)
+        route = request.scope.get("route")
+        # Unmatched paths share one label so scanners cannot blow up cardinality.
+        route_label = route.path if route is not None else "unmatched"
+        HTTP_REQUEST_SECONDS.labels(request.method, route_label, str(status_code)).observe(elapsed)
+        REQUEST_DB_QUERIES.labels(request.method, route_label).observe(usage[0])
+        REQUEST_DB_SECONDS.labels(request.method, route_label).observe(usage[1])
+
+
+# SQLite FTS5 index over tender text, maintained by triggers so every write
+# path (routes, bulk imports, manual SQL) keeps it in sync.
+TENDER_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tenders_fts USING fts5("
+    "title, description, content='tenders', content_rowid='id', "
+    "tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS tenders_fts_ai AFTER INSERT ON tenders BEGIN "
+    "INSERT INTO tenders_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tenders_fts_ad AFTER DELETE ON tenders BEGIN "
+    "INSERT INTO tenders_fts(tenders_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tenders_fts_au AFTER UPDATE OF title, description ON tenders BEGIN "
+    "INSERT INTO tenders_fts(tenders_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tenders_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+]
+
+tenders_fts = table("tenders_fts", column("rowid"))
+
+
+def ensure_tender_search_index() -> None:
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as conn:
+        exists = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tenders_fts'"
+        ).first()
+        for ddl in TENDER_SEARCH_DDL:
+            conn.exec_driver_sql(ddl)
+        if not exists:
+            conn.exec_driver_sql("INSERT INTO tenders_fts(tenders_fts) VALUES ('rebuild')")
+
+
 @app.on_event("startup")
 def on_startup():
     ensure_upload_dir()
-    Base.metadata.create_all(bind=engine)
+    migrate_database(engine)
+    ensure_tender_search_index()
 
     # Dev-only bootstrap users so you can log in immediately
     db = SessionLocal()
@@ -429,31 +1579,120 @@ def on_startup():
 
             db.add_all([admin, issuer, bidder, auditor])
             db.commit()
+
+        backfill_tender_stats(db)
+
+        if TENDER_SCHEDULER_ENABLED:
+            tender_scheduler.load(db)
+            tender_scheduler.start()
     finally:
         db.close()
 
+    submission_queue.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    tender_scheduler.stop()
+    await run_in_threadpool(submission_queue.stop)
+    await async_engine.dispose()
+
+# ------------ Caching ------------
+
+class VersionedTTLCache:
+    """Thread-safe LRU whose entries expire after ``ttl_seconds``.
+
+    ``invalidate()`` drops the given keys (or everything) and bumps
+    ``version``. Callers that compute a value from the database read
+    ``version`` first and pass it to ``put``, which discards the value if an
+    invalidation happened in between, so a result computed from rows read
+    before a write is never stored. The cache is per process; the TTL bounds
+    how long other workers serve a stale entry after a write.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 30.0):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self.version = 0
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None:
+                return None
+            if hit[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return hit[1]
+
+    def put(self, key: Any, value: Any, version: Optional[int] = None) -> None:
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *keys: Any) -> None:
+        with self._lock:
+            self.version += 1
+            if not keys:
+                self._entries.clear()
+            for key in keys:
+                self._entries.pop(key, None)
+
 # ------------ Auth deps & routes ------------
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
 
-def get_current_user(
-    db: Session = Depends(get_db),
+PRINCIPAL_FIELDS = ("id", "email", "full_name", "role", "is_active", "created_at")
+
+# Snapshots of active users keyed by token subject. They are dropped whenever
+# the ``users`` row is updated or deleted through the ORM (see the mapper
+# hooks below); the TTL bounds staleness for changes made by other processes.
+principal_cache = VersionedTTLCache(max_entries=4096)
+
+
+def cache_principal(user: User) -> None:
+    principal_cache.put(user.email, {field: getattr(user, field) for field in PRINCIPAL_FIELDS})
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_principal(mapper, connection, target: User) -> None:
+    principal_cache.invalidate(target.email)
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_async_db),
     token: str = Depends(oauth2_scheme),
 ) -> User:
-    subject = decode_token(token)
+    claims = decode_token_claims(token)
+    subject = claims.get("sub") if claims else None
     if subject is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
-    user = get_user_by_email(db, subject)
-    if not user or not user.is_active:
+    snapshot = principal_cache.get(subject)
+    # Tokens minted for a different user id (e.g. an email re-registered after
+    # deletion) fall through to the database check below and are rejected.
+    if snapshot is not None and claims.get("uid") in (None, snapshot["id"]):
+        return User(**snapshot)
+
+    user = (await db.execute(select(User).where(User.email == subject))).scalars().first()
+    if not user or not user.is_active or claims.get("uid") not in (None, user.id):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Inactive or invalid user",
         )
+    cache_principal(user)
     return user
 
 
@@ -472,16 +1711,14 @@ def register(user_in: UserCreate, db: Session = Depends(get_db)):
         role=user_in.role.value,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
-    audit_log(
-        db=db,
-        actor_id=user.id,
-        action="user_register",
-        resource_type="user",
-        resource_id=str(user.id),
-        payload={"email": user.email, "role": user.role},
-    )
+    with audit_chain.unit_of_work(db) as record:
+        record(
+            actor_id=user.id,
+            action="user_register",
+            resource_type="user",
+            resource_id=str(user.id),
+            payload={"email": user.email, "role": user.role},
+        )
     return user
 
 
@@ -491,12 +1728,22 @@ def login(
     db: Session = Depends(get_db),
 ):
     user = get_user_by_email(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    valid, new_hash = False, None
+    if user:
+        valid, new_hash = password_hasher.verify_and_update(
+            form_data.password, user.hashed_password
+        )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
         )
-    access_token = create_access_token(subject=user.email)
+    if new_hash:
+        user.hashed_password = new_hash
+        db.commit()
+    access_token = create_access_token(subject=user.email, user_id=user.id)
+    if user.is_active:
+        cache_principal(user)
     audit_log(
         db=db,
         actor_id=user.id,
@@ -533,31 +1780,180 @@ def create_tender(
         status=TenderStatus.draft,
     )
     db.add(tender)
-    db.commit()
-    db.refresh(tender)
-    audit_log(
-        db=db,
-        actor_id=current_user.id,
-        action="tender_create",
-        resource_type="tender",
-        resource_id=str(tender.id),
-        payload={"title": tender.title},
-    )
+    with audit_chain.unit_of_work(db) as record:
+        record(
+            actor_id=current_user.id,
+            action="tender_create",
+            resource_type="tender",
+            resource_id=str(tender.id),
+            payload={"title": tender.title},
+        )
+    tender_list_cache.invalidate()
+    tender_scheduler.track(tender)
     return tender
 
 
-@app.get("/tenders", response_model=List[TenderRead])
-def list_tenders(db: Session = Depends(get_db)):
-    tenders = db.query(Tender).order_by(Tender.id.desc()).all()
-    return tenders
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag == etag or tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+# Serialized ``/tenders`` pages keyed by query parameters; every tender write
+# calls ``invalidate()``.
+tender_list_cache = VersionedTTLCache()
+_tender_list_adapters = {
+    TenderView.full: TypeAdapter(List[TenderRead]),
+    TenderView.summary: TypeAdapter(List[TenderSummary]),
+}
+_tender_stats_models = {
+    TenderView.full: TenderReadWithStats,
+    TenderView.summary: TenderSummaryWithStats,
+}
+_tender_stats_adapters = {
+    view: TypeAdapter(List[model]) for view, model in _tender_stats_models.items()
+}
+_TENDER_SUMMARY_COLUMNS = [getattr(Tender, name) for name in TenderSummary.model_fields]
+
+
+@app.get("/tenders", response_model=List[TenderSummary])
+async def list_tenders(
+    request: Request,
+    limit: int = Query(100, ge=1, le=500),
+    before_id: Optional[int] = Query(None, description="Return tenders older than this id."),
+    status_filter: Optional[TenderStatus] = Query(None, alias="status"),
+    owner_id: Optional[int] = None,
+    closes_after: Optional[datetime] = None,
+    closes_before: Optional[datetime] = None,
+    view: TenderView = Query(
+        TenderView.full,
+        description="summary omits descriptions; full adds them to the summary fields.",
+    ),
+    include_stats: bool = Query(
+        False,
+        description="Embed submission_count; may lag new bids by the cache TTL.",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    closes_after = as_utc_naive(closes_after)
+    closes_before = as_utc_naive(closes_before)
+    key = (limit, before_id, status_filter, owner_id, closes_after, closes_before, view, include_stats)
+    cached = tender_list_cache.get(key)
+    if cached is None:
+        version = tender_list_cache.version
+        if view == TenderView.summary:
+            stmt = select(*_TENDER_SUMMARY_COLUMNS)
+        else:
+            stmt = select(Tender)
+        if before_id is not None:
+            stmt = stmt.where(Tender.id < before_id)
+        if status_filter is not None:
+            stmt = stmt.where(Tender.status == status_filter)
+        if owner_id is not None:
+            stmt = stmt.where(Tender.owner_id == owner_id)
+        if closes_after is not None:
+            stmt = stmt.where(Tender.close_at >= closes_after)
+        if closes_before is not None:
+            stmt = stmt.where(Tender.close_at < closes_before)
+        result = await db.execute(stmt.order_by(Tender.id.desc()).limit(limit))
+        tenders = result.all() if view == TenderView.summary else result.scalars().all()
+
+        adapter = _tender_list_adapters[view]
+        items = adapter.validate_python(tenders, from_attributes=True)
+        if include_stats:
+            counts = dict(
+                (
+                    await db.execute(
+                        select(TenderStats.tender_id, TenderStats.submission_count).where(
+                            TenderStats.tender_id.in_([item.id for item in items])
+                        )
+                    )
+                ).all()
+            )
+            model = _tender_stats_models[view]
+            items = [
+                model(**item.model_dump(), submission_count=counts.get(item.id, 0))
+                for item in items
+            ]
+            adapter = _tender_stats_adapters[view]
+        body = adapter.dump_json(items)
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        next_cursor = str(tenders[-1].id) if len(tenders) == limit else None
+        cached = (etag, body, next_cursor)
+        tender_list_cache.put(key, cached, version)
+
+    etag, body, next_cursor = cached
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if next_cursor is not None:
+        headers["X-Next-Cursor"] = next_cursor
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def fts_match_expression(q: str) -> Optional[str]:
+    # Keep only word tokens and quote them so user input can never be parsed
+    # as FTS5 syntax; the last term is a prefix match for search-as-you-type.
+    terms = ['"' + term + '"' for term in re.findall(r"\w+", q)]
+    if not terms:
+        return None
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+@app.get("/tenders/search", response_model=List[TenderSearchHit])
+async def search_tenders(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    status_filter: Optional[TenderStatus] = Query(None, alias="status"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    match = fts_match_expression(q)
+    if match is None:
+        return []
+
+    if engine.dialect.name == "sqlite":
+        fts = literal_column("tenders_fts")
+        rank = func.bm25(fts, 10.0, 1.0)
+        stmt = (
+            select(
+                *_TENDER_SUMMARY_COLUMNS,
+                func.snippet(fts, -1, "<mark>", "</mark>", "…", 12).label("snippet"),
+                (-rank).label("score"),
+            )
+            .select_from(tenders_fts.join(Tender, Tender.id == tenders_fts.c.rowid))
+            .where(fts.match(match))
+            .order_by(rank)
+        )
+    else:
+        # Escape LIKE wildcards so "%", "_" and backslashes in the query match literally.
+        pattern = "%" + re.sub(r"([\\%_])", r"\\\1", q.strip()) + "%"
+        stmt = (
+            select(
+                *_TENDER_SUMMARY_COLUMNS,
+                func.substr(Tender.description, 1, 160).label("snippet"),
+                literal_column("0.0").label("score"),
+            )
+            .where(
+                or_(
+                    Tender.title.ilike(pattern, escape="\\"),
+                    Tender.description.ilike(pattern, escape="\\"),
+                )
+            )
+            .order_by(Tender.id.desc())
+        )
+    if status_filter is not None:
+        stmt = stmt.where(Tender.status == status_filter)
+    rows = (await db.execute(stmt.limit(limit))).all()
+    return [TenderSearchHit.model_validate(row, from_attributes=True) for row in rows]
 
 
 @app.get("/tenders/{tender_id}", response_model=TenderRead)
-def get_tender(tender_id: int, db: Session = Depends(get_db)):
-    tender = db.query(Tender).filter(Tender.id == tender_id).first()
-    if not tender:
-        raise HTTPException(status_code=404, detail="Tender not found")
-    return tender
+async def get_tender(tender_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await get_tender_or_404_async(db, tender_id)
 
 
 @app.put("/tenders/{tender_id}", response_model=TenderRead)
@@ -597,18 +1993,17 @@ def update_tender(
         tender.status = tender_in.status
         changed["status"] = tender_in.status.value
 
-    db.commit()
-    db.refresh(tender)
-
-    if changed:
-        audit_log(
-            db=db,
-            actor_id=current_user.id,
-            action="tender_update",
-            resource_type="tender",
-            resource_id=str(tender.id),
-            payload=changed,
-        )
+    with audit_chain.unit_of_work(db) as record:
+        if changed:
+            record(
+                actor_id=current_user.id,
+                action="tender_update",
+                resource_type="tender",
+                resource_id=str(tender.id),
+                payload=changed,
+            )
+    tender_list_cache.invalidate()
+    tender_scheduler.track(tender)
     return tender
 
 
@@ -631,22 +2026,28 @@ def publish_tender(
             detail="Only draft tenders can be published.",
         )
 
-    tender.status = TenderStatus.published
-    tender.publish_at = datetime.utcnow()
+    now = datetime.utcnow()
+    publish_at = as_utc_naive(body.publish_at)
+    if publish_at is None or publish_at <= now:
+        tender.status = TenderStatus.published
+        publish_at = now
+    tender.publish_at = publish_at
     if body.close_at is not None:
-        tender.close_at = body.close_at
+        tender.close_at = as_utc_naive(body.close_at)
 
-    db.commit()
-    db.refresh(tender)
-
-    audit_log(
-        db=db,
-        actor_id=current_user.id,
-        action="tender_publish",
-        resource_type="tender",
-        resource_id=str(tender.id),
-        payload={"close_at": tender.close_at.isoformat() if tender.close_at else None},
-    )
+    with audit_chain.unit_of_work(db) as record:
+        record(
+            actor_id=current_user.id,
+            action="tender_publish",
+            resource_type="tender",
+            resource_id=str(tender.id),
+            payload={
+                "close_at": tender.close_at.isoformat() if tender.close_at else None,
+                "publish_at": publish_at.isoformat(),
+            },
+        )
+    tender_list_cache.invalidate()
+    tender_scheduler.track(tender)
     return tender
 
 
@@ -672,18 +2073,17 @@ def close_tender(
     if tender.close_at is None:
         tender.close_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(tender)
-
-    audit_log(
-        db=db,
-        actor_id=current_user.id,
-        action="tender_close",
-        resource_type="tender",
-        resource_id=str(tender.id),
-        payload={},
-    )
-    return tender
+    with audit_chain.unit_of_work(db) as record:
+        record(
+            actor_id=current_user.id,
+            action="tender_close",
+            resource_type="tender",
+            resource_id=str(tender.id),
+            payload={},
+        )
+    tender_list_cache.invalidate()
+    tender_scheduler.track(tender)
+    return tender
 
 
 @app.post("/tenders/{tender_id}/award", response_model=TenderRead)
@@ -714,17 +2114,16 @@ def award_tender(
         raise HTTPException(status_code=404, detail="Submission not found for this tender.")
 
     tender.status = TenderStatus.awarded
-    db.commit()
-    db.refresh(tender)
-
-    audit_log(
-        db=db,
-        actor_id=current_user.id,
-        action="tender_award",
-        resource_type="tender",
-        resource_id=str(tender.id),
-        payload={"submission_id": submission.id},
-    )
+    with audit_chain.unit_of_work(db) as record:
+        record(
+            actor_id=current_user.id,
+            action="tender_award",
+            resource_type="tender",
+            resource_id=str(tender.id),
+            payload={"submission_id": submission.id},
+        )
+    tender_list_cache.invalidate()
+    tender_scheduler.track(tender)
     return tender
 
 
@@ -740,19 +2139,212 @@ def delete_tender(
 
     require_owner_or_admin(current_user, tender.owner_id)
 
-    db.delete(tender)
-    db.commit()
-
-    audit_log(
-        db=db,
-        actor_id=current_user.id,
-        action="tender_delete",
-        resource_type="tender",
-        resource_id=str(tender_id),
-        payload={},
-    )
+    with audit_chain.unit_of_work(db) as record:
+        # Inside the unit of work so the head row is locked before any other
+        # write lock, the order every audited writer takes them in.
+        db.query(TenderStats).filter(TenderStats.tender_id == tender_id).delete(
+            synchronize_session=False
+        )
+        db.delete(tender)
+        record(
+            actor_id=current_user.id,
+            action="tender_delete",
+            resource_type="tender",
+            resource_id=str(tender_id),
+            payload={},
+        )
+    tender_list_cache.invalidate()
+    tender_scheduler.forget(tender_id)
     return None
 
+# ------------ Deadline scheduler ------------
+
+def as_utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize to the naive-UTC form used for every stored timestamp."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+TENDER_SCHEDULER_ENABLED = os.getenv("TENDER_SCHEDULER_ENABLED", "true").lower() in ("1", "true", "yes")
+_FINAL_TENDER_STATUSES = (TenderStatus.closed, TenderStatus.awarded, TenderStatus.cancelled)
+
+
+class TenderDeadlineScheduler:
+    """Publishes and closes tenders at their ``publish_at`` / ``close_at``.
+
+    Upcoming deadlines sit in a min-heap that is loaded once at startup and
+    kept current by the tender routes; one thread sleeps until the earliest
+    deadline instead of polling the table. Alongside it, an in-memory map of
+    ``tender_id -> (status, close_at)`` lets submissions past the deadline be
+    rejected without a query. Transitions are conditional updates, so several
+    worker processes running their own scheduler close a tender only once.
+
+    Each tender has at most one live transition, kept in ``_due``; heap entries
+    that no longer match it (a moved deadline, a closed tender) are dropped
+    when they are popped. When disabled only the status map is kept.
+    """
+
+    def __init__(self, session_factory, enabled: bool = True):
+        self._session_factory = session_factory
+        self._enabled = enabled
+        self._cond = threading.Condition()
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._status: Dict[int, tuple] = {}
+        self._due: Dict[int, tuple] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def load(self, db: Session) -> None:
+        tenders = (
+            db.query(Tender)
+            .filter(
+                or_(
+                    (Tender.status == TenderStatus.published) & Tender.close_at.isnot(None),
+                    (Tender.status == TenderStatus.draft) & Tender.publish_at.isnot(None),
+                )
+            )
+            .all()
+        )
+        for tender in tenders:
+            self.track(tender)
+
+    def track(self, tender: Tender) -> None:
+        """Record ``tender``'s current state and schedule its next transition."""
+        close_at = as_utc_naive(tender.close_at)
+        publish_at = as_utc_naive(tender.publish_at)
+        with self._cond:
+            if tender.status == TenderStatus.published and close_at is not None:
+                self._status[tender.id] = (tender.status, close_at)
+                self._push(close_at, tender.id, "close")
+            elif tender.status in _FINAL_TENDER_STATUSES:
+                self._status[tender.id] = (tender.status, close_at)
+                self._due.pop(tender.id, None)
+            else:
+                self._status.pop(tender.id, None)
+                if tender.status == TenderStatus.draft and publish_at is not None:
+                    self._push(publish_at, tender.id, "publish")
+                else:
+                    self._due.pop(tender.id, None)
+
+    def forget(self, tender_id: int) -> None:
+        with self._cond:
+            self._status.pop(tender_id, None)
+            self._due.pop(tender_id, None)
+
+    def accepts_submissions(self, tender_id: int) -> bool:
+        """True if ``tender_id`` is tracked as published and before its deadline."""
+        entry = self._status.get(tender_id)
+        if entry is None:
+            return False
+        tender_status, close_at = entry
+        return (
+            tender_status == TenderStatus.published
+            and close_at is not None
+            and datetime.utcnow() < close_at
+        )
+
+    def submission_block_reason(self, tender_id: int) -> Optional[str]:
+        entry = self._status.get(tender_id)
+        if entry is None:
+            return None
+        tender_status, close_at = entry
+        if tender_status in _FINAL_TENDER_STATUSES:
+            return "Tender is no longer accepting submissions."
+        if close_at is not None and datetime.utcnow() >= close_at:
+            return "The submission deadline for this tender has passed."
+        return None
+
+    def _push(self, due: datetime, tender_id: int, action: str) -> None:
+        if not self._enabled or self._due.get(tender_id) == (due, action):
+            return
+        self._due[tender_id] = (due, action)
+        heapq.heappush(self._heap, (due, next(self._seq), tender_id, action))
+        self._cond.notify()
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="tender-deadlines", daemon=True
+            )
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopping:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = (self._heap[0][0] - datetime.utcnow()).total_seconds()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(timeout=delay)
+                if self._stopping:
+                    return
+                due, _, tender_id, action = heapq.heappop(self._heap)
+                if self._due.get(tender_id) != (due, action):
+                    continue  # superseded by a later track()
+                del self._due[tender_id]
+            try:
+                self._fire(tender_id, action)
+            except Exception:
+                logger.exception("Scheduled %s of tender %s failed", action, tender_id)
+
+    def _fire(self, tender_id: int, action: str) -> None:
+        now = datetime.utcnow()
+        if action == "close":
+            condition = [
+                Tender.status == TenderStatus.published,
+                Tender.close_at <= now,
+            ]
+            values = {Tender.status: TenderStatus.closed}
+        else:
+            condition = [
+                Tender.status == TenderStatus.draft,
+                Tender.publish_at <= now,
+            ]
+            values = {Tender.status: TenderStatus.published}
+
+        db = self._session_factory()
+        try:
+            with audit_chain.unit_of_work(db) as record:
+                changed = (
+                    db.query(Tender)
+                    .filter(Tender.id == tender_id, *condition)
+                    .update(values, synchronize_session=False)
+                )
+                if changed:
+                    record(
+                        actor_id=None,
+                        action=f"tender_auto_{action}",
+                        resource_type="tender",
+                        resource_id=str(tender_id),
+                        payload={"at": now.isoformat()},
+                    )
+            tender = db.get(Tender, tender_id)
+            if tender is not None:
+                self.track(tender)
+            if changed:
+                tender_list_cache.invalidate()
+        finally:
+            db.close()
+
+
+tender_scheduler = TenderDeadlineScheduler(SessionLocal, enabled=TENDER_SCHEDULER_ENABLED)
+
 # ------------ Submission routes ------------
 
 def get_tender_or_404(db: Session, tender_id: int) -> Tender:
@@ -762,19 +2354,40 @@ def get_tender_or_404(db: Session, tender_id: int) -> Tender:
     return tender
 
 
-@app.post(
-    "/tenders/{tender_id}/submissions",
-    response_model=SubmissionRead,
-    status_code=status.HTTP_201_CREATED,
-)
-def create_submission_for_tender(
-    tender_id: int,
-    submission_in: SubmissionCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
+async def get_tender_or_404_async(db: AsyncSession, tender_id: int) -> Tender:
+    tender = await db.get(Tender, tender_id)
+    if not tender:
+        raise HTTPException(status_code=404, detail="Tender not found")
+    return tender
+
+
+def ensure_accepting_submissions(db: Session, tender_id: int) -> None:
+    # Open tenders with a tracked deadline are answered from memory; the row
+    # is only read for tenders the scheduler does not know about.
+    if tender_scheduler.accepts_submissions(tender_id):
+        return
+    blocked = tender_scheduler.submission_block_reason(tender_id)
+    if blocked:
+        raise HTTPException(status_code=400, detail=blocked)
     tender = get_tender_or_404(db, tender_id)
+    close_at = as_utc_naive(tender.close_at)
+    if tender.status in _FINAL_TENDER_STATUSES or (
+        close_at is not None and datetime.utcnow() >= close_at
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="This tender is no longer accepting submissions.",
+        )
+
+
+def submission_fields(
+    tender_id: int, submission_in: SubmissionCreate, current_user: User
+) -> Dict[str, Any]:
+    """Column values for a new submission.
 
+    Anonymous bids keep the commitment and the scoring inputs (amount, B-BBEE
+    level, years in service) but drop the identifying supplier details.
+    """
     is_anonymous = submission_in.is_anonymous
     anonymous_commit = None
     nonce_hint = None
@@ -798,29 +2411,142 @@ def create_submission_for_tender(
         if submission_in.payload:
             encrypted_payload = submission_in.payload
 
-    submission = Submission(
-        tender_id=tender.id,
-        bidder_id=bidder_id,
-        is_anonymous=is_anonymous,
-        anonymous_commitment=anonymous_commit,
-        anonymous_nonce_hint=nonce_hint,
-        encrypted_payload=encrypted_payload,
-        amount=submission_in.amount,
-        notes=submission_in.notes,
-    )
+    supplier = {}
+    if not is_anonymous:
+        supplier = {
+            "company_name": submission_in.company_name,
+            "tax_number": submission_in.tax_number,
+            "csd_number": submission_in.csd_number,
+        }
+    return {
+        "tender_id": tender_id,
+        "bidder_id": bidder_id,
+        "is_anonymous": is_anonymous,
+        "anonymous_commitment": anonymous_commit,
+        "anonymous_nonce_hint": nonce_hint,
+        "encrypted_payload": encrypted_payload,
+        "amount": submission_in.amount,
+        "notes": submission_in.notes,
+        "bbbee_level": submission_in.bbbee_level,
+        "years_in_service": submission_in.years_in_service,
+        **supplier,
+    }
+
+
+def apply_submission_stats(db: Session, submissions: List[Submission]) -> None:
+    """Fold new bids into their tenders' ``TenderStats`` rows.
+
+    Runs inside the caller's unit of work, so the aggregates commit or roll
+    back together with the bids; the audit chain head lock held there also
+    keeps two writers from racing to create the same row.
+    """
+    deltas: Dict[int, list] = {}
+    for sub in submissions:
+        delta = deltas.setdefault(sub.tender_id, [0, 0, 0, 0.0, None, None])
+        delta[0] += 1
+        delta[1] += 1 if sub.is_anonymous else 0
+        if sub.amount is not None:
+            delta[2] += 1
+            delta[3] += sub.amount
+            delta[4] = sub.amount if delta[4] is None else min(delta[4], sub.amount)
+            delta[5] = sub.amount if delta[5] is None else max(delta[5], sub.amount)
+
+    now = datetime.utcnow()
+    for tender_id, (count, anonymous, priced, total, low, high) in deltas.items():
+        values = {
+            TenderStats.submission_count: TenderStats.submission_count + count,
+            TenderStats.anonymous_count: TenderStats.anonymous_count + anonymous,
+            TenderStats.priced_count: TenderStats.priced_count + priced,
+            TenderStats.amount_sum: TenderStats.amount_sum + total,
+            TenderStats.updated_at: now,
+        }
+        if low is not None:
+            values[TenderStats.amount_min] = case(
+                (or_(TenderStats.amount_min.is_(None), TenderStats.amount_min > low), low),
+                else_=TenderStats.amount_min,
+            )
+            values[TenderStats.amount_max] = case(
+                (or_(TenderStats.amount_max.is_(None), TenderStats.amount_max < high), high),
+                else_=TenderStats.amount_max,
+            )
+        updated = (
+            db.query(TenderStats)
+            .filter(TenderStats.tender_id == tender_id)
+            .update(values, synchronize_session=False)
+        )
+        if not updated:
+            db.add(
+                TenderStats(
+                    tender_id=tender_id,
+                    submission_count=count,
+                    anonymous_count=anonymous,
+                    priced_count=priced,
+                    amount_sum=total,
+                    amount_min=low,
+                    amount_max=high,
+                    updated_at=now,
+                )
+            )
 
-    db.add(submission)
-    db.commit()
-    db.refresh(submission)
 
-    audit_log(
-        db=db,
-        actor_id=current_user.id,
-        action="submission_create",
-        resource_type="submission",
-        resource_id=str(submission.id),
-        payload={"tender_id": tender.id, "is_anonymous": is_anonymous},
+def backfill_tender_stats(db: Session) -> None:
+    """Create stats rows for tenders whose bids predate ``tender_stats``."""
+    missing = (
+        select(
+            Submission.tender_id,
+            func.count(Submission.id),
+            func.count(case((Submission.is_anonymous, 1))),
+            func.count(Submission.amount),
+            func.coalesce(func.sum(Submission.amount), 0.0),
+            func.min(Submission.amount),
+            func.max(Submission.amount),
+            func.max(Submission.created_at),
+        )
+        .where(~Submission.tender_id.in_(select(TenderStats.tender_id)))
+        .group_by(Submission.tender_id)
     )
+    db.execute(
+        insert(TenderStats).from_select(
+            [
+                "tender_id",
+                "submission_count",
+                "anonymous_count",
+                "priced_count",
+                "amount_sum",
+                "amount_min",
+                "amount_max",
+                "updated_at",
+            ],
+            missing,
+        )
+    )
+    db.commit()
+
+
+@app.post(
+    "/tenders/{tender_id}/submissions",
+    response_model=SubmissionRead,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_submission_for_tender(
+    tender_id: int,
+    submission_in: SubmissionCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    ensure_accepting_submissions(db, tender_id)
+    submission = Submission(**submission_fields(tender_id, submission_in, current_user))
+
+    db.add(submission)
+    with audit_chain.unit_of_work(db) as record:
+        apply_submission_stats(db, [submission])
+        record(
+            actor_id=current_user.id,
+            action="submission_create",
+            resource_type="submission",
+            resource_id=str(submission.id),
+            payload={"tender_id": tender_id, "is_anonymous": submission.is_anonymous},
+        )
 
     return submission
 
@@ -829,12 +2555,12 @@ def create_submission_for_tender(
     "/tenders/{tender_id}/submissions",
     response_model=List[SubmissionRead],
 )
-def list_submissions_for_tender(
+async def list_submissions_for_tender(
     tender_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    tender = get_tender_or_404(db, tender_id)
+    tender = await get_tender_or_404_async(db, tender_id)
     is_owner = tender.owner_id == current_user.id
     is_admin = current_user.role == UserRole.admin.value
     if not (is_owner or is_admin):
@@ -842,40 +2568,68 @@ def list_submissions_for_tender(
             status_code=403,
             detail="Only the tender owner or admin can list submissions.",
         )
-    submissions = (
-        db.query(Submission)
-        .filter(Submission.tender_id == tender.id)
+    result = await db.execute(
+        select(Submission)
+        .where(Submission.tender_id == tender.id)
         .order_by(Submission.id.desc())
-        .all()
     )
-    return submissions
+    return result.scalars().all()
+
+
+@app.get("/tenders/{tender_id}/stats", response_model=TenderStatsRead)
+async def get_tender_stats(
+    tender_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    tender = await get_tender_or_404_async(db, tender_id)
+    is_owner = tender.owner_id == current_user.id
+    is_admin = current_user.role == UserRole.admin.value
+    if not (is_owner or is_admin):
+        raise HTTPException(
+            status_code=403,
+            detail="Only the tender owner or admin can view submission stats.",
+        )
+    stats = await db.get(TenderStats, tender.id)
+    if stats is None:
+        return TenderStatsRead(tender_id=tender.id)
+    return TenderStatsRead(
+        tender_id=tender.id,
+        submission_count=stats.submission_count,
+        anonymous_count=stats.anonymous_count,
+        named_count=stats.submission_count - stats.anonymous_count,
+        priced_count=stats.priced_count,
+        amount_min=stats.amount_min,
+        amount_max=stats.amount_max,
+        amount_mean=stats.amount_sum / stats.priced_count if stats.priced_count else None,
+        updated_at=stats.updated_at,
+    )
 
 
 @app.get("/submissions/mine", response_model=List[SubmissionRead])
-def list_my_submissions(
-    db: Session = Depends(get_db),
+async def list_my_submissions(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    submissions = (
-        db.query(Submission)
-        .filter(Submission.bidder_id == current_user.id)
+    result = await db.execute(
+        select(Submission)
+        .where(Submission.bidder_id == current_user.id)
         .order_by(Submission.id.desc())
-        .all()
     )
-    return submissions
+    return result.scalars().all()
 
 
 @app.get("/submissions/{submission_id}", response_model=SubmissionRead)
-def get_submission(
+async def get_submission(
     submission_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    submission = db.query(Submission).filter(Submission.id == submission_id).first()
+    submission = await db.get(Submission, submission_id)
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
-    tender = db.query(Tender).filter(Tender.id == submission.tender_id).first()
+    tender = await db.get(Tender, submission.tender_id)
     is_owner = tender and tender.owner_id == current_user.id
     is_bidder = submission.bidder_id == current_user.id
     is_admin = current_user.role == UserRole.admin.value
@@ -887,30 +2641,783 @@ def get_submission(
         )
     return submission
 
+
+MAX_REVEAL_ITEMS = 10000
+
+
+def verify_reveals(items: List[RevealItem], sealed: Dict[int, tuple]) -> List[RevealResult]:
+    """Check each (payload, nonce) against the stored commitment in one pass.
+
+    ``sealed`` maps submission id to ``(anonymous_commitment, amount)`` for
+    the tender's bids; digests are compared in constant time.
+    """
+    results = []
+    for item in items:
+        stored = sealed.get(item.submission_id)
+        if stored is None:
+            status_ = "not_found"
+        elif stored[0] is None:
+            status_ = "not_sealed"
+        elif hmac.compare_digest(sha256_commitment(item.payload, item.nonce), stored[0]):
+            results.append(RevealResult(submission_id=item.submission_id, status="verified", amount=stored[1]))
+            continue
+        else:
+            status_ = "mismatch"
+        results.append(RevealResult(submission_id=item.submission_id, status=status_))
+    return results
+
+
+@app.post("/tenders/{tender_id}/submissions/reveal", response_model=RevealResponse)
+def reveal_submissions(
+    tender_id: int,
+    reveal_in: RevealRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    tender = get_tender_or_404(db, tender_id)
+    require_owner_or_admin(current_user, tender.owner_id)
+    if tender.status not in (TenderStatus.closed, TenderStatus.awarded):
+        raise HTTPException(
+            status_code=400,
+            detail="Sealed bids can only be opened once the tender has closed.",
+        )
+    if len(reveal_in.items) > MAX_REVEAL_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_REVEAL_ITEMS} bids can be revealed per request.",
+        )
+
+    ids = {item.submission_id for item in reveal_in.items}
+    sealed = {
+        sub_id: (commitment, amount)
+        for sub_id, commitment, amount in db.execute(
+            select(Submission.id, Submission.anonymous_commitment, Submission.amount).where(
+                Submission.tender_id == tender.id, Submission.id.in_(ids)
+            )
+        )
+    }
+    results = verify_reveals(reveal_in.items, sealed)
+    verified = [result.submission_id for result in results if result.status == "verified"]
+    rejected = [result.submission_id for result in results if result.status != "verified"]
+
+    audit_chain.append(
+        db,
+        actor_id=current_user.id,
+        action="submission_reveal",
+        resource_type="tender",
+        resource_id=str(tender.id),
+        payload={"verified": len(verified), "rejected_ids": rejected},
+    )
+    return RevealResponse(
+        tender_id=tender.id,
+        verified=len(verified),
+        rejected=len(rejected),
+        results=results,
+    )
+
+# ------------ Submission ingestion journal ------------
+
+SUBMISSION_JOURNAL_PATH = os.getenv(
+    "SUBMISSION_JOURNAL_PATH",
+    os.path.join(os.getcwd(), "journal", "submissions.ndjson"),
+)
+SUBMISSION_INGEST_BATCH_SIZE = int(os.getenv("SUBMISSION_INGEST_BATCH_SIZE", "500"))
+SUBMISSION_INGEST_MAX_ATTEMPTS = 5
+
+
+def _open_locked(path: str, blocking: bool):
+    """Open ``path`` for appending under an exclusive ``flock``.
+
+    Returns None when ``blocking`` is false and another process holds the lock.
+    The inode is re-checked after locking, since a worker adopting an orphaned
+    journal unlinks it while still holding the lock.
+    """
+    while True:
+        fh = open(path, "ab")
+        if fcntl is None:
+            return fh
+        try:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            fh.close()
+            return None
+        try:
+            if os.stat(path).st_ino == os.fstat(fh.fileno()).st_ino:
+                return fh
+        except FileNotFoundError:
+            pass
+        fh.close()
+        if not blocking:
+            return None
+
+
+class _JournalEntry:
+    __slots__ = ("record", "end_offset", "error", "done")
+
+    def __init__(self, record: Dict[str, Any]):
+        self.record = record
+        self.end_offset = 0
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+
+class SubmissionIngestQueue:
+    """Durable intake for bids that arrive in bursts before a deadline.
+
+    ``append`` writes the bid to an append-only NDJSON journal and returns once
+    it is fsynced; callers that queue up behind a write are flushed together
+    with one fsync, like the audit writer's group commit. A background thread
+    drains the journal into ``submissions`` in batches, one transaction and
+    one chained audit entry per bid. Inserts are keyed by ``receipt_id``, so
+    records left in the journal by a crash are replayed on ``start`` without
+    duplicates, and the journal is truncated whenever it is fully drained.
+    Bids that cannot be stored are moved to a side file (``<journal>.rejected``)
+    and folded back into the journal on the next ``start`` for another try.
+
+    Each worker process journals to its own ``<path>.<pid>`` file and holds an
+    exclusive ``flock`` on it while running. On ``start`` a worker adopts the
+    journals whose lock it can take, i.e. those left behind by workers that
+    have exited, so nothing is replayed while its owner is still draining it.
+    """
+
+    def __init__(self, path: str, session_factory, batch_size: int = 500):
+        self._base_path = path
+        self._path = self._journal_path()
+        self._rejected_path = self._path + ".rejected"
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._file = None
+        self._write_lock = threading.Lock()
+        self._queue_lock = threading.Lock()
+        self._queue: List[_JournalEntry] = []
+        self._cond = threading.Condition()
+        self._ready: deque = deque()
+        self._pending: set = set()
+        self._rejected: Dict[str, str] = {}
+        self._committed_offset = 0
+        self._set_aside: List[Dict[str, Any]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def _journal_path(self) -> str:
+        return f"{self._base_path}.{os.getpid()}"
+
+    def _open(self) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            self._file = _open_locked(self._path, blocking=True)
+
+    def _write(self, batch: List[_JournalEntry]) -> None:
+        start = None
+        try:
+            self._open()
+            start = self._file.tell()
+            for entry in batch:
+                line = json.dumps(entry.record, separators=(",", ":")) + "\n"
+                self._file.write(line.encode("utf-8"))
+                entry.end_offset = self._file.tell()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except Exception as exc:
+            # Drop a torn tail so the next write starts on a fresh line.
+            if start is not None:
+                with suppress(Exception):
+                    self._file.truncate(start)
+            for entry in batch:
+                entry.error = exc
+        else:
+            with self._cond:
+                for entry in batch:
+                    self._pending.add(entry.record["receipt_id"])
+                    self._ready.append(entry)
+                self._cond.notify()
+        finally:
+            for entry in batch:
+                entry.done = True
+
+    def append(self, record: Dict[str, Any]) -> None:
+        entry = _JournalEntry(record)
+        with self._queue_lock:
+            self._queue.append(entry)
+        with self._write_lock:
+            # An earlier lock holder may already have fsynced our record.
+            while not entry.done:
+                with self._queue_lock:
+                    batch, self._queue = self._queue, []
+                self._write(batch)
+        if entry.error is not None:
+            raise entry.error
+
+    def status(self, receipt_id: str) -> Optional[str]:
+        """``queued`` or ``rejected`` for bids not (yet) in the table, else None."""
+        with self._cond:
+            if receipt_id in self._pending:
+                return "queued"
+        return "rejected" if receipt_id in self._rejected else None
+
+    def rejection_reason(self, receipt_id: str) -> Optional[str]:
+        return self._rejected.get(receipt_id)
+
+    def _restore_rejected(self) -> None:
+        if not os.path.exists(self._rejected_path):
+            return
+        with open(self._rejected_path, "rb") as fh:
+            lines = [line for line in fh if line.endswith(b"\n")]
+        if lines:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with open(self._path, "ab") as fh:
+                fh.writelines(lines)
+                fh.flush()
+                os.fsync(fh.fileno())
+        # Replays are keyed by receipt_id, so a crash before this unlink only
+        # means those bids are seen twice.
+        os.remove(self._rejected_path)
+
+    def _adopt_orphans(self) -> None:
+        """Fold journals left by exited workers into this worker's journal."""
+        directory = os.path.dirname(self._base_path)
+        prefix = os.path.basename(self._base_path)
+        if not os.path.isdir(directory):
+            return
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            # The bare base path is where a single journal used to live.
+            if path != self._base_path and not (
+                name.startswith(prefix + ".") and name[len(prefix) + 1:].isdigit()
+            ):
+                continue
+            if path == self._path:
+                continue
+            orphan = _open_locked(path, blocking=False)
+            if orphan is None:
+                continue  # its worker is still running
+            try:
+                lines = []
+                for source in (path + ".rejected", path):
+                    if os.path.exists(source):
+                        with open(source, "rb") as fh:
+                            lines.extend(line for line in fh if line.endswith(b"\n"))
+                if lines:
+                    with self._write_lock:
+                        self._open()
+                        self._file.writelines(lines)
+                        self._file.flush()
+                        os.fsync(self._file.fileno())
+                    logger.info("Adopted %s journaled submissions from %s", len(lines), name)
+                # Unlink while still holding the lock; a crash in between only
+                # means the same bids are replayed twice, which is harmless.
+                with suppress(FileNotFoundError):
+                    os.remove(path + ".rejected")
+                os.remove(path)
+            finally:
+                orphan.close()
+
+    def _replay(self) -> None:
+        self._restore_rejected()
+        self._adopt_orphans()
+        if not os.path.exists(self._path):
+            return
+        entries = []
+        offset = 0
+        with open(self._path, "rb") as fh:
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                try:
+                    entry = _JournalEntry(json.loads(line))
+                except ValueError:
+                    logger.warning("Skipping unreadable submission journal line ending at %s", offset)
+                    continue
+                entry.end_offset = offset
+                entries.append(entry)
+        with self._write_lock:
+            if os.path.getsize(self._path) != offset:
+                with open(self._path, "r+b") as fh:
+                    fh.truncate(offset)
+                self._file.seek(0, os.SEEK_END)
+        with self._cond:
+            for entry in entries:
+                self._pending.add(entry.record["receipt_id"])
+                self._ready.append(entry)
+        if entries:
+            logger.info("Replaying %s journaled submissions", len(entries))
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        # Workers forked from a preloading parent inherit its pid-based path.
+        with self._write_lock:
+            if self._path != self._journal_path():
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._path = self._journal_path()
+                self._rejected_path = self._path + ".rejected"
+            self._open()
+        self._replay()
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="submission-ingest", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Drain what is already journaled, then stop the worker."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._write_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._ready and not self._stopping:
+                    self._cond.wait()
+                if not self._ready:
+                    return
+                count = min(len(self._ready), self._batch_size)
+                batch = [self._ready.popleft() for _ in range(count)]
+            self._commit(batch)
+
+    def _insert(self, db: Session, records: List[Dict[str, Any]]) -> None:
+        receipts = [rec["receipt_id"] for rec in records]
+        existing = set(
+            db.scalars(
+                select(Submission.receipt_id).where(Submission.receipt_id.in_(receipts))
+            )
+        )
+        fresh = [rec for rec in records if rec["receipt_id"] not in existing]
+        if not fresh:
+            return
+        submissions = [
+            Submission(
+                receipt_id=rec["receipt_id"],
+                created_at=datetime.fromisoformat(rec["received_at"]),
+                **rec["fields"],
+            )
+            for rec in fresh
+        ]
+        db.add_all(submissions)
+        with audit_chain.unit_of_work(db) as record:
+            apply_submission_stats(db, submissions)
+            for rec, submission in zip(fresh, submissions):
+                record(
+                    actor_id=rec["actor_id"],
+                    action="submission_create",
+                    resource_type="submission",
+                    resource_id=str(submission.id),
+                    payload={
+                        "tender_id": submission.tender_id,
+                        "is_anonymous": submission.is_anonymous,
+                        "receipt_id": rec["receipt_id"],
+                    },
+                )
+
+    def _commit(self, batch: List[_JournalEntry]) -> None:
+        records = [entry.record for entry in batch]
+        db = self._session_factory()
+        try:
+            for attempt in range(1, SUBMISSION_INGEST_MAX_ATTEMPTS + 1):
+                try:
+                    self._insert(db, records)
+                    break
+                except Exception:
+                    db.rollback()
+                    logger.exception(
+                        "Submission batch of %s failed (attempt %s)", len(records), attempt
+                    )
+                    if attempt < SUBMISSION_INGEST_MAX_ATTEMPTS:
+                        time.sleep(0.2 * attempt)
+            else:
+                # Isolate the records that cannot be stored; they are set
+                # aside and retried on the next start.
+                for rec in records:
+                    try:
+                        self._insert(db, [rec])
+                    except Exception as exc:
+                        db.rollback()
+                        self._rejected[rec["receipt_id"]] = str(exc)
+                        with self._write_lock:
+                            self._set_aside.append(rec)
+        finally:
+            db.close()
+        with self._cond:
+            for rec in records:
+                self._pending.discard(rec["receipt_id"])
+        self._advance(batch[-1].end_offset)
+
+    def _write_set_aside(self) -> bool:
+        """Persist rejected records to the side file; False if that failed."""
+        try:
+            with open(self._rejected_path, "ab") as fh:
+                for rec in self._set_aside:
+                    fh.write((json.dumps(rec, separators=(",", ":")) + "\n").encode("utf-8"))
+                fh.flush()
+                os.fsync(fh.fileno())
+        except OSError:
+            logger.exception("Could not set aside %s rejected submissions", len(self._set_aside))
+            return False
+        self._set_aside = []
+        return True
+
+    def _advance(self, end_offset: int) -> None:
+        with self._write_lock:
+            self._committed_offset = max(self._committed_offset, end_offset)
+            # Rejected records must be on disk elsewhere before the journal
+            # holding them can be truncated; retried on every drain until so.
+            if self._set_aside and not self._write_set_aside():
+                return
+            self._open()
+            if self._committed_offset == self._file.tell():
+                self._file.truncate(0)
+                self._file.seek(0)
+                self._committed_offset = 0
+
+
+submission_queue = SubmissionIngestQueue(
+    SUBMISSION_JOURNAL_PATH, SessionLocal, SUBMISSION_INGEST_BATCH_SIZE
+)
+
+
+@app.post(
+    "/tenders/{tender_id}/submissions/queued",
+    response_model=SubmissionReceipt,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def queue_submission_for_tender(
+    tender_id: int,
+    submission_in: SubmissionCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    ensure_accepting_submissions(db, tender_id)
+    fields = submission_fields(tender_id, submission_in, current_user)
+    # Hand the connection back before waiting on the journal fsync.
+    db.close()
+    receipt_id = uuid.uuid4().hex
+    received_at = datetime.utcnow()
+    record = {
+        "receipt_id": receipt_id,
+        "received_at": received_at.isoformat(),
+        "actor_id": current_user.id,
+        "fields": fields,
+    }
+    commitment = sha256_commitment(
+        payload=json.dumps(record, sort_keys=True, separators=(",", ":")),
+        nonce=receipt_id,
+    )
+    try:
+        submission_queue.append(record)
+    except OSError:
+        logger.exception("Could not journal submission for tender %s", tender_id)
+        raise HTTPException(
+            status_code=503,
+            detail="Submission could not be recorded, please retry.",
+            headers={"Retry-After": "1"},
+        )
+    return SubmissionReceipt(
+        receipt_id=receipt_id,
+        tender_id=tender_id,
+        received_at=received_at,
+        commitment=commitment,
+    )
+
+
+@app.get("/submissions/receipts/{receipt_id}", response_model=SubmissionReceiptStatus)
+async def get_submission_receipt(
+    receipt_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Look up a journaled bid; the unguessable receipt id is the capability."""
+    submission_id = await db.scalar(
+        select(Submission.id).where(Submission.receipt_id == receipt_id)
+    )
+    if submission_id is not None:
+        return SubmissionReceiptStatus(
+            receipt_id=receipt_id, status="committed", submission_id=submission_id
+        )
+    state = submission_queue.status(receipt_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Receipt not found")
+    return SubmissionReceiptStatus(
+        receipt_id=receipt_id,
+        status=state,
+        detail=submission_queue.rejection_reason(receipt_id),
+    )
+
+
+# ------------ Evaluation & ranking ------------
+
+# Preferential Procurement Regulations, 2017 (PPPFA): 80/20 up to R50 million,
+# 90/10 above, with preference points awarded by B-BBEE contributor level 1-8.
+# The 2022 regulations keep the 80/20 and 90/10 split but replace the level
+# tables with specific goals set by each organ of state, which are not modelled.
+PREFERENCE_SYSTEM_THRESHOLD = 50_000_000
+PREFERENCE_SYSTEMS = {
+    PreferenceSystem.p80_20: (80, (20, 18, 14, 12, 8, 6, 4, 2)),
+    PreferenceSystem.p90_10: (90, (10, 9, 6, 5, 4, 3, 2, 1)),
+}
+RANKING_CACHE_SIZE = 256
+_BBBEE_LEVEL_RE = re.compile(r"\d+")
+
+
+def parse_bbbee_level(value: Optional[str]) -> Optional[int]:
+    """Contributor level 1-8 from free text such as "2", "Level 2" or "L2"."""
+    if not value:
+        return None
+    match = _BBBEE_LEVEL_RE.search(value)
+    if match is None:
+        return None
+    level = int(match.group())
+    return level if 1 <= level <= 8 else None
+
+
+def resolve_preference_system(
+    system: PreferenceSystem, estimated_budget: Optional[int]
+) -> PreferenceSystem:
+    if system is not PreferenceSystem.auto:
+        return system
+    if estimated_budget is not None and estimated_budget > PREFERENCE_SYSTEM_THRESHOLD:
+        return PreferenceSystem.p90_10
+    return PreferenceSystem.p80_20
+
+
+def rank_submissions(rows, system: PreferenceSystem):
+    """Score and order ``(id, bidder_id, is_anonymous, company_name, amount,
+    bbbee_level, years_in_service)`` rows under an 80/20 or 90/10 system.
+
+    Price points are ``P * (1 - (Pt - Pmin) / Pmin)``, floored at zero, and
+    preference points come from the B-BBEE level table (non-compliant: 0).
+    Ties go to the higher preference score, then to the earlier bid. Returns
+    ``(lowest_amount, ranked_tuples, unpriced_count)``.
+    """
+    price_weight, level_points = PREFERENCE_SYSTEMS[system]
+    priced = [row for row in rows if row[4] is not None and row[4] > 0]
+    if not priced:
+        return None, [], len(rows)
+    lowest = min(row[4] for row in priced)
+    # Level strings repeat heavily, so parse each distinct one once.
+    levels: Dict[Optional[str], Optional[int]] = {}
+    scored = []
+    for sub_id, bidder_id, is_anonymous, company, amount, level_text, years in priced:
+        level = levels.get(level_text, -1)
+        if level == -1:
+            level = levels[level_text] = parse_bbbee_level(level_text)
+        price_points = max(0.0, price_weight * (2 - amount / lowest))
+        preference_points = float(level_points[level - 1]) if level else 0.0
+        scored.append(
+            (
+                round(price_points + preference_points, 2),
+                preference_points,
+                sub_id,
+                bidder_id,
+                is_anonymous,
+                company,
+                float(amount),
+                level,
+                years,
+                round(price_points, 2),
+            )
+        )
+    scored.sort(key=lambda item: (-item[0], -item[1], item[2]))
+    return float(lowest), scored, len(rows) - len(priced)
+
+
+# Scored bids per (tender, system). The audit chain listener below drops a
+# tender's entries whenever it gets a new bid or is changed.
+ranking_cache = VersionedTTLCache(RANKING_CACHE_SIZE)
+
+
+def invalidate_tender_ranking(tender_id: int) -> None:
+    ranking_cache.invalidate(*[(tender_id, system) for system in PreferenceSystem])
+
+
+def _invalidate_rankings(entries: List[Dict[str, Any]]) -> None:
+    for entry in entries:
+        if entry["action"] == "submission_create":
+            invalidate_tender_ranking(entry["payload"]["tender_id"])
+        elif entry["resource_type"] == "tender" and entry["resource_id"]:
+            # A budget change can move the tender across the 80/20 threshold.
+            invalidate_tender_ranking(int(entry["resource_id"]))
+
+
+audit_chain.add_listener(_invalidate_rankings)
+
+_RANKING_COLUMNS = [
+    Submission.id,
+    Submission.bidder_id,
+    Submission.is_anonymous,
+    Submission.company_name,
+    Submission.amount,
+    Submission.bbbee_level,
+    Submission.years_in_service,
+]
+
+
+@app.get("/tenders/{tender_id}/ranking", response_model=TenderRanking)
+async def get_tender_ranking(
+    tender_id: int,
+    system: PreferenceSystem = Query(PreferenceSystem.auto),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    tender = await get_tender_or_404_async(db, tender_id)
+    is_owner = tender.owner_id == current_user.id
+    is_admin = current_user.role == UserRole.admin.value
+    if not (is_owner or is_admin):
+        raise HTTPException(
+            status_code=403,
+            detail="Only the tender owner or admin can view the ranking.",
+        )
+    resolved = resolve_preference_system(system, tender.estimated_budget)
+    key = (tender.id, resolved)
+    cached = ranking_cache.get(key)
+    if cached is None:
+        version = ranking_cache.version
+        rows = (
+            await db.execute(
+                select(*_RANKING_COLUMNS).where(Submission.tender_id == tender.id)
+            )
+        ).all()
+        cached = rank_submissions(rows, resolved)
+        ranking_cache.put(key, cached, version)
+    lowest, scored, unpriced = cached
+
+    results = [
+        RankedSubmission(
+            rank=offset + position,
+            submission_id=item[2],
+            bidder_id=item[3],
+            is_anonymous=item[4],
+            company_name=item[5],
+            amount=item[6],
+            bbbee_level=item[7],
+            years_in_service=item[8],
+            price_points=item[9],
+            preference_points=item[1],
+            total_points=item[0],
+        )
+        for position, item in enumerate(scored[offset : offset + limit], start=1)
+    ]
+    return TenderRanking(
+        tender_id=tender.id,
+        system=resolved,
+        lowest_amount=lowest,
+        ranked_count=len(scored),
+        unpriced_count=unpriced,
+        results=results,
+    )
+
+
 # ------------ Document storage helpers & routes ------------
 
-def save_document_file(file: UploadFile) -> (str, str):
-    ensure_upload_dir()
-    filename = file.filename or "unnamed"
-    safe_name = filename.replace("/", "_").replace("\\", "_")
-    dest_path = os.path.join(BASE_UPLOAD_DIR, safe_name)
-    base, ext = os.path.splitext(dest_path)
-    counter = 1
-    while os.path.exists(dest_path):
-        dest_path = f"{base}_{counter}{ext}"
-        counter += 1
+def upload_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Uploads are limited to {MAX_UPLOAD_BYTES} bytes.",
+    )
+
+
+BLOB_DIR = os.path.join(BASE_UPLOAD_DIR, "blobs")
+
+
+def blob_path(checksum: str) -> str:
+    return os.path.join(BLOB_DIR, checksum[:2], checksum)
+
+
+def save_document_file(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES):
+    """Stream ``file`` into a temp file in the blob store, hashing as it goes.
+
+    Returns ``(tmp_path, checksum, size)``; ``acquire_blob`` then moves the
+    temp file into place or discards it if the content is already stored.
+    Blocking; call from a worker thread.
+    """
+    if file.size is not None and file.size > max_bytes:
+        raise upload_too_large()
+    os.makedirs(BLOB_DIR, exist_ok=True)
 
     hasher = hashlib.sha256()
-    with open(dest_path, "wb") as out_file:
-        while True:
-            chunk = file.file.read(8192)
-            if not chunk:
-                break
-            hasher.update(chunk)
-            out_file.write(chunk)
-    file.file.seek(0)
-    checksum = hasher.hexdigest()
-    return dest_path, checksum
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=BLOB_DIR, prefix=".upload-", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out_file:
+            while True:
+                chunk = file.file.read(UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise upload_too_large()
+                hasher.update(chunk)
+                out_file.write(chunk)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return tmp_path, hasher.hexdigest(), size
+
+
+def acquire_blob(db: Session, tmp_path: str, checksum: str, size: int) -> str:
+    """Take a reference on the blob for ``checksum`` and return its path.
+
+    New content is atomically renamed into place; for known content the temp
+    file is left for the caller to discard. Call inside
+    ``audit_chain.unit_of_work``, whose head lock serializes blob changes
+    across workers.
+    """
+    taken = (
+        db.query(DocumentBlob)
+        .filter(DocumentBlob.checksum == checksum)
+        .update({DocumentBlob.ref_count: DocumentBlob.ref_count + 1}, synchronize_session=False)
+    )
+    if not taken:
+        path = blob_path(checksum)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+        db.add(DocumentBlob(checksum=checksum, storage_path=path, size_bytes=size, ref_count=1))
+        return path
+    path = (
+        db.query(DocumentBlob.storage_path).filter(DocumentBlob.checksum == checksum).scalar()
+    )
+    if not os.path.exists(path):
+        os.replace(tmp_path, path)
+    return path
+
+
+def release_blob(db: Session, doc: Document) -> Optional[str]:
+    """Drop ``doc``'s blob reference; return the file to remove, if any.
+
+    Documents stored before the blob store existed own a standalone file,
+    even when a blob with the same checksum was created since.
+    """
+    if not doc.checksum:
+        return doc.stored_path
+    blob_ref = (DocumentBlob.checksum == doc.checksum) & (
+        DocumentBlob.storage_path == doc.stored_path
+    )
+    released = (
+        db.query(DocumentBlob)
+        .filter(blob_ref)
+        .update({DocumentBlob.ref_count: DocumentBlob.ref_count - 1}, synchronize_session=False)
+    )
+    if not released:
+        return doc.stored_path
+    emptied = (
+        db.query(DocumentBlob)
+        .filter(blob_ref, DocumentBlob.ref_count <= 0)
+        .delete(synchronize_session=False)
+    )
+    return doc.stored_path if emptied else None
 
 
 @app.post(
@@ -928,49 +3435,87 @@ async def upload_document(
     if visibility not in {"public", "internal", "restricted"}:
         raise HTTPException(status_code=400, detail="Invalid visibility value.")
 
-    stored_path, checksum = save_document_file(file)
-    doc = Document(
-        owner_id=current_user.id,
-        tender_id=tender_id,
-        original_filename=file.filename or "unnamed",
-        stored_path=stored_path,
-        mime_type=file.content_type,
-        checksum=checksum,
-        visibility=visibility,
-    )
-    db.add(doc)
-    db.commit()
-    db.refresh(doc)
-
-    audit_log(
-        db=db,
-        actor_id=current_user.id,
-        action="document_upload",
-        resource_type="document",
-        resource_id=str(doc.id),
-        payload={"tender_id": tender_id, "visibility": visibility},
-    )
-
-    return doc
+    # File I/O and the chained audit commit are blocking; keep them off the
+    # event loop.
+    started = time.perf_counter()
+    tmp_path, checksum, size = await run_in_threadpool(save_document_file, file)
+    UPLOAD_BYTES.inc(size)
+    UPLOAD_BYTES_PER_SECOND.observe(size / max(time.perf_counter() - started, 1e-6))
+
+    def persist() -> Document:
+        try:
+            with audit_chain.unit_of_work(db) as record:
+                doc = Document(
+                    owner_id=current_user.id,
+                    tender_id=tender_id,
+                    original_filename=file.filename or "unnamed",
+                    stored_path=acquire_blob(db, tmp_path, checksum, size),
+                    mime_type=file.content_type,
+                    checksum=checksum,
+                    visibility=visibility,
+                )
+                db.add(doc)
+                db.flush()
+                record(
+                    actor_id=current_user.id,
+                    action="document_upload",
+                    resource_type="document",
+                    resource_id=str(doc.id),
+                    payload={"tender_id": tender_id, "visibility": visibility},
+                )
+        finally:
+            with suppress(OSError):
+                os.unlink(tmp_path)
+        db.refresh(doc)
+        return doc
+
+    return await run_in_threadpool(persist)
 
 
 @app.get("/documents", response_model=List[DocumentRead])
-def list_my_documents(
-    db: Session = Depends(get_db),
+async def list_my_documents(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    docs = (
-        db.query(Document)
-        .filter(Document.owner_id == current_user.id)
+    result = await db.execute(
+        select(Document)
+        .where(Document.owner_id == current_user.id)
         .order_by(Document.id.desc())
-        .all()
     )
-    return docs
+    return result.scalars().all()
+
+
+def document_visible_to(doc: Document, user: User) -> bool:
+    return doc.visibility == "public" or doc.owner_id == user.id
+
+
+# "x-accel-redirect" (nginx) or "x-sendfile" (Apache/lighttpd) hands the
+# byte transfer to the front proxy; empty serves files from Python.
+DOCUMENT_SENDFILE_MODE = os.getenv("DOCUMENT_SENDFILE_MODE", "").lower()
+DOCUMENT_ACCEL_PREFIX = os.getenv("DOCUMENT_ACCEL_PREFIX", "/protected-documents/")
+
+DOCUMENT_CACHE_CONTROL = {
+    "public": "public, max-age=86400",
+    "internal": "private, max-age=0, must-revalidate",
+    "restricted": "private, no-store",
+}
+
+
+class DocumentFileResponse(FileResponse):
+    """FileResponse whose If-Range validator is the document checksum ETag."""
+
+    def __init__(self, *args, etag: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.document_etag = etag
+
+    def _should_use_range(self, http_if_range: str, stat_result: os.stat_result) -> bool:
+        return self.document_etag is not None and http_if_range == self.document_etag
 
 
 @app.get("/documents/{document_id}")
 def download_document(
     document_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -978,16 +3523,149 @@ def download_document(
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    if doc.visibility in {"internal", "restricted"} and doc.owner_id != current_user.id:
+    if not document_visible_to(doc, current_user):
         raise HTTPException(status_code=403, detail="Not allowed to access this document")
 
+    headers = {"Cache-Control": DOCUMENT_CACHE_CONTROL.get(doc.visibility, "private, no-store")}
+    etag = f'"{doc.checksum}"' if doc.checksum else None
+    if etag:
+        headers["ETag"] = etag
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
     if not os.path.exists(doc.stored_path):
         raise HTTPException(status_code=410, detail="File missing on server")
 
-    return FileResponse(
+    media_type = doc.mime_type or "application/octet-stream"
+    if DOCUMENT_SENDFILE_MODE in ("x-accel-redirect", "x-sendfile"):
+        headers["Content-Disposition"] = "attachment; filename*=utf-8''" + quote(doc.original_filename)
+        if DOCUMENT_SENDFILE_MODE == "x-accel-redirect":
+            relative = os.path.relpath(doc.stored_path, BASE_UPLOAD_DIR).replace(os.sep, "/")
+            headers["X-Accel-Redirect"] = DOCUMENT_ACCEL_PREFIX.rstrip("/") + "/" + quote(relative)
+        else:
+            headers["X-Sendfile"] = os.path.abspath(doc.stored_path)
+        return Response(media_type=media_type, headers=headers)
+
+    return DocumentFileResponse(
         path=doc.stored_path,
         filename=doc.original_filename,
-        media_type=doc.mime_type or "application/octet-stream",
+        media_type=media_type,
+        headers=headers,
+        etag=etag,
+    )
+
+
+@app.get("/tenders/{tender_id}/documents", response_model=List[DocumentRead])
+async def list_tender_documents(
+    tender_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    await get_tender_or_404_async(db, tender_id)
+    result = await db.execute(
+        select(Document)
+        .where(
+            Document.tender_id == tender_id,
+            or_(Document.visibility == "public", Document.owner_id == current_user.id),
+        )
+        .order_by(Document.id)
+    )
+    return result.scalars().all()
+
+
+# Already-compressed formats are stored as-is; deflating them again only
+# burns CPU.
+STORED_ZIP_EXTENSIONS = {
+    ".pdf", ".zip", ".gz", ".7z", ".rar", ".jpg", ".jpeg", ".png",
+    ".docx", ".xlsx", ".pptx", ".odt", ".ods", ".mp4",
+}
+
+
+class _ZipStreamSink(io.RawIOBase):
+    """Unseekable sink for ``zipfile`` whose output is drained by a generator."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._offset = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_documents_zip(entries: List[tuple]) -> Iterator[bytes]:
+    """Yield a ZIP archive of ``(arcname, path, created_at)`` entries as it is built.
+
+    Nothing is staged on disk and at most one read chunk is buffered, so
+    memory use does not depend on archive size.
+    """
+    sink = _ZipStreamSink()
+    with zipfile.ZipFile(sink, mode="w", allowZip64=True) as archive:
+        for arcname, path, created_at in entries:
+            try:
+                src = open(path, "rb")
+            except OSError:
+                continue
+            with src:
+                info = zipfile.ZipInfo(arcname, date_time=created_at.timetuple()[:6])
+                ext = os.path.splitext(arcname)[1].lower()
+                info.compress_type = (
+                    zipfile.ZIP_STORED if ext in STORED_ZIP_EXTENSIONS else zipfile.ZIP_DEFLATED
+                )
+                with archive.open(info, "w", force_zip64=True) as dest:
+                    while True:
+                        chunk = src.read(UPLOAD_CHUNK_BYTES)
+                        if not chunk:
+                            break
+                        dest.write(chunk)
+                        data = sink.drain()
+                        if data:
+                            yield data
+            yield sink.drain()
+    yield sink.drain()
+
+
+@app.get("/tenders/{tender_id}/documents.zip")
+def download_tender_documents_zip(
+    tender_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    tender = get_tender_or_404(db, tender_id)
+    docs = (
+        db.query(Document)
+        .filter(Document.tender_id == tender.id)
+        .order_by(Document.id)
+        .all()
+    )
+    entries = [
+        (
+            f"{doc.id}-" + os.path.basename(doc.original_filename.replace("\\", "/")),
+            doc.stored_path,
+            doc.created_at,
+        )
+        for doc in docs
+        if document_visible_to(doc, current_user)
+    ]
+    return StreamingResponse(
+        stream_documents_zip(entries),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="tender-{tender.id}-documents.zip"'
+        },
     )
 
 
@@ -1004,30 +3682,559 @@ def delete_document(
     if doc.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not allowed to delete this document")
 
+    db.delete(doc)
+    retired: Optional[tuple] = None
     try:
-        if os.path.exists(doc.stored_path):
-            os.remove(doc.stored_path)
-    except OSError:
-        pass
+        with audit_chain.unit_of_work(db) as record:
+            unlink_path = release_blob(db, doc)
+            if unlink_path and os.path.exists(unlink_path):
+                # Moved aside before commit, while the audit head lock keeps
+                # uploads out: an upload of the same content committed right
+                # after this one writes a fresh file rather than losing it to
+                # our unlink.
+                retired = (unlink_path, f"{unlink_path}.deleted-{uuid.uuid4().hex}")
+                os.replace(*retired)
+            record(
+                actor_id=current_user.id,
+                action="document_delete",
+                resource_type="document",
+                resource_id=str(document_id),
+                payload={},
+            )
+    except BaseException:
+        if retired:
+            os.replace(retired[1], retired[0])
+        raise
+    if retired:
+        with suppress(OSError):
+            os.remove(retired[1])
+    return None
 
-    db.delete(doc)
-    db.commit()
+# ------------ Bulk export helpers ------------
 
-    audit_log(
-        db=db,
-        actor_id=current_user.id,
-        action="document_delete",
-        resource_type="document",
-        resource_id=str(document_id),
-        payload={},
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+EXPORT_FETCH_SIZE = 1000
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _encode_export_rows(rows, columns: List[str], fmt: ExportFormat) -> Iterator[str]:
+    if fmt == ExportFormat.ndjson:
+        for row in rows:
+            yield json.dumps(
+                {col: _export_value(row[col]) for col in columns},
+                separators=(",", ":"),
+            ) + "\n"
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(
+            [
+                json.dumps(value) if isinstance(value, (dict, list)) else _export_value(value)
+                for value in (row[col] for col in columns)
+            ]
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_export(stmt, columns: List[str], fmt: ExportFormat, compress: bool) -> Iterator[bytes]:
+    """Yield ``stmt`` rows as NDJSON or CSV bytes, optionally gzip-compressed.
+
+    Rows come from a server-side cursor on a dedicated session, so memory use
+    does not depend on the size of the export.
+    """
+    db = SessionLocal()
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    pending: List[bytes] = []
+    pending_size = 0
+    try:
+        result = db.execute(
+            stmt.execution_options(stream_results=True, yield_per=EXPORT_FETCH_SIZE)
+        )
+        rows = (row._mapping for row in result)
+        for chunk in _encode_export_rows(rows, columns, fmt):
+            data = chunk.encode("utf-8")
+            if compressor is not None:
+                data = compressor.compress(data)
+            if data:
+                pending.append(data)
+                pending_size += len(data)
+            if pending_size >= EXPORT_CHUNK_BYTES:
+                yield b"".join(pending)
+                pending, pending_size = [], 0
+        if compressor is not None:
+            pending.append(compressor.flush())
+        if pending:
+            yield b"".join(pending)
+    finally:
+        db.close()
+
+
+def export_response(stmt, columns: List[str], fmt: ExportFormat, compress: bool, basename: str) -> StreamingResponse:
+    filename = f"{basename}.{fmt.value}" + (".gz" if compress else "")
+    if compress:
+        media_type = "application/gzip"
+    elif fmt == ExportFormat.ndjson:
+        media_type = "application/x-ndjson"
+    else:
+        media_type = "text/csv"
+    return StreamingResponse(
+        stream_export(stmt, columns, fmt, compress),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
-    return None
+
+
+SUBMISSION_EXPORT_COLUMNS = [
+    "id",
+    "tender_id",
+    "bidder_id",
+    "is_anonymous",
+    "anonymous_commitment",
+    "amount",
+    "notes",
+    "created_at",
+    "company_name",
+    "bbbee_level",
+    "years_in_service",
+    "tax_number",
+    "csd_number",
+]
+
+AUDIT_EXPORT_COLUMNS = [
+    "id",
+    "actor_id",
+    "action",
+    "resource_type",
+    "resource_id",
+    "payload",
+    "created_at",
+    "immutable_signature",
+]
+
+
+@app.get("/tenders/{tender_id}/submissions/export")
+def export_submissions_for_tender(
+    tender_id: int,
+    format: ExportFormat = ExportFormat.ndjson,
+    gzip: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    tender = get_tender_or_404(db, tender_id)
+    is_owner = tender.owner_id == current_user.id
+    is_admin = current_user.role == UserRole.admin.value
+    if not (is_owner or is_admin):
+        raise HTTPException(
+            status_code=403,
+            detail="Only the tender owner or admin can export submissions.",
+        )
+    stmt = (
+        select(*(getattr(Submission, col) for col in SUBMISSION_EXPORT_COLUMNS))
+        .where(Submission.tender_id == tender.id)
+        .order_by(Submission.id)
+    )
+    return export_response(
+        stmt, SUBMISSION_EXPORT_COLUMNS, format, gzip, f"tender-{tender.id}-submissions"
+    )
+
+# ------------ Bulk tender import ------------
+
+TENDER_IMPORT_BATCH_SIZE = 1000
+TENDER_IMPORT_MAX_ERRORS = 100
+_TENDER_CREATE_FIELDS = list(TenderCreate.model_fields)
+_tender_create_adapter = TypeAdapter(TenderCreate)
+
+
+def iter_import_rows(fh, fmt: ExportFormat) -> Iterator[tuple]:
+    """Yield ``(line_number, row)`` from a text stream of CSV or NDJSON tenders.
+
+    Rows that cannot be parsed at all are yielded as ``(line_number, error)``
+    strings so the caller can report them alongside validation errors.
+    """
+    if fmt == ExportFormat.csv:
+        reader = csv.DictReader(fh)
+        for row in reader:
+            # Empty CSV cells mean "not given", not an empty string.
+            yield reader.line_num, {key: value for key, value in row.items() if value not in ("", None)}
+        return
+    for line_number, line in enumerate(fh, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield line_number, f"invalid JSON: {exc}"
+            continue
+        yield line_number, row if isinstance(row, dict) else "expected a JSON object"
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}" for err in exc.errors()
+    )
+
+
+def import_tenders(
+    db: Session,
+    rows: Iterator[tuple],
+    owner: User,
+    batch_size: int = TENDER_IMPORT_BATCH_SIZE,
+    source: Optional[str] = None,
+) -> TenderImportResult:
+    """Insert validated rows as draft tenders, one transaction per batch.
+
+    Each batch is a single multi-row ``INSERT ... RETURNING`` plus one
+    chained ``tender_import`` audit entry covering its id range, committed
+    together; the FTS triggers index the new rows in the same transaction.
+    Rows that fail validation are skipped and reported by line number.
+    """
+    result = TenderImportResult(imported=0, rejected=0, batches=0, errors=[])
+
+    def reject(line_number: int, message: str) -> None:
+        result.rejected += 1
+        if len(result.errors) < TENDER_IMPORT_MAX_ERRORS:
+            result.errors.append(TenderImportError(line=line_number, error=message))
+
+    def flush(batch: List[Dict[str, Any]]) -> None:
+        with audit_chain.unit_of_work(db) as record:
+            ids = db.execute(insert(Tender).returning(Tender.id), batch).scalars().all()
+            ids.sort()
+            record(
+                actor_id=owner.id,
+                action="tender_import",
+                resource_type="tender_batch",
+                resource_id=f"{ids[0]}-{ids[-1]}",
+                payload={"count": len(ids), "first_id": ids[0], "last_id": ids[-1], "source": source},
+            )
+        result.imported += len(ids)
+        result.batches += 1
+        result.first_id = ids[0] if result.first_id is None else result.first_id
+        result.last_id = ids[-1]
+        tender_list_cache.invalidate()
+
+    now = datetime.utcnow()
+    batch: List[Dict[str, Any]] = []
+    for line_number, row in rows:
+        if isinstance(row, str):
+            reject(line_number, row)
+            continue
+        try:
+            tender_in = _tender_create_adapter.validate_python(
+                {key: row[key] for key in _TENDER_CREATE_FIELDS if key in row}
+            )
+        except ValidationError as exc:
+            reject(line_number, _validation_message(exc))
+            continue
+        batch.append(
+            {
+                "owner_id": owner.id,
+                "title": tender_in.title,
+                "description": tender_in.description,
+                "estimated_budget": tender_in.estimated_budget,
+                "status": TenderStatus.draft,
+                "created_at": now,
+            }
+        )
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    return result
+
+
+def open_import_stream(raw, filename: Optional[str]):
+    """Text view of an uploaded or local file, gunzipping ``*.gz`` on the fly."""
+    if filename and filename.endswith(".gz"):
+        raw = gzip.GzipFile(fileobj=raw, mode="rb")
+    return io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+
+
+def guess_import_format(filename: Optional[str]) -> ExportFormat:
+    name = (filename or "").removesuffix(".gz").lower()
+    return ExportFormat.csv if name.endswith(".csv") else ExportFormat.ndjson
+
+
+@app.post("/tenders/import", response_model=TenderImportResult)
+def import_tenders_upload(
+    file: UploadFile = File(...),
+    fmt: Optional[ExportFormat] = Query(None, alias="format"),
+    batch_size: int = Query(TENDER_IMPORT_BATCH_SIZE, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    require_role(current_user, [UserRole.issuer.value, UserRole.admin.value])
+    fmt = fmt or guess_import_format(file.filename)
+    try:
+        rows = iter_import_rows(open_import_stream(file.file, file.filename), fmt)
+        return import_tenders(db, rows, current_user, batch_size, source=file.filename)
+    except (UnicodeDecodeError, OSError, csv.Error) as exc:
+        # Batches committed before the bad byte stay imported.
+        raise HTTPException(status_code=400, detail=f"Could not read import file: {exc}")
+
+
+# ------------ Event stream ------------
+
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "1000"))
+EVENT_KEEPALIVE_SECONDS = 15
+_AUDIT_EVENT_ROLES = frozenset({UserRole.admin.value, UserRole.auditor.value})
+
+
+class _EventSubscriber:
+    __slots__ = ("user_id", "role", "queue")
+
+    def __init__(self, user: User):
+        self.user_id = user.id
+        self.role = user.role
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+
+
+class EventHub:
+    """In-process fan-out for the ``/events`` stream.
+
+    ``publish`` may be called from any thread; events are handed to the event
+    loop with ``call_soon_threadsafe`` and copied into one bounded queue per
+    subscriber whose role or user id they are addressed to. A subscriber that
+    falls behind is disconnected rather than buffered without limit, and
+    reconnects. Like the caches, the hub only sees writes made by this process.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: set = set()
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self, user: User) -> _EventSubscriber:
+        self._loop = asyncio.get_running_loop()
+        subscriber = _EventSubscriber(user)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: _EventSubscriber) -> None:
+        self._subscribers.discard(subscriber)
+
+    def publish(self, events: List[Dict[str, Any]]) -> None:
+        loop = self._loop
+        if not events or loop is None or loop.is_closed():
+            return
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(self._dispatch, events)
+
+    def _dispatch(self, events: List[Dict[str, Any]]) -> None:
+        for subscriber in list(self._subscribers):
+            for evt in events:
+                roles, user_ids = evt["roles"], evt["user_ids"]
+                if roles is not None and subscriber.role not in roles and subscriber.user_id not in user_ids:
+                    continue
+                try:
+                    subscriber.queue.put_nowait(evt)
+                except asyncio.QueueFull:
+                    self._subscribers.discard(subscriber)
+                    while not subscriber.queue.empty():
+                        subscriber.queue.get_nowait()
+                    subscriber.queue.put_nowait(None)
+                    break
+
+
+event_hub = EventHub()
+
+
+def _event(
+    name: str,
+    event_id: int,
+    data: Dict[str, Any],
+    roles=None,
+    user_ids=(),
+) -> Dict[str, Any]:
+    return {"event": name, "id": event_id, "data": data, "roles": roles, "user_ids": frozenset(user_ids)}
+
+
+def publish_audit_events(entries: List[Dict[str, Any]]) -> None:
+    """Turn committed audit entries into stream events.
+
+    Tender changes go to everyone with the tender as it now reads, new bids
+    refresh the tender's submission count for its owner, admins and auditors,
+    and the bidder gets their own submission as it now reads.
+    """
+    if not event_hub.has_subscribers:
+        return
+    tender_ids = set()
+    counted_ids = set()
+    submission_ids = set()
+    for entry in entries:
+        if entry["resource_type"] == "tender" and entry["resource_id"]:
+            tender_ids.add(int(entry["resource_id"]))
+        elif entry["action"] == "submission_create":
+            counted_ids.add(entry["payload"]["tender_id"])
+            submission_ids.add(int(entry["resource_id"]))
+
+    tenders: Dict[int, Tender] = {}
+    tender_data: Dict[int, Dict[str, Any]] = {}
+    submission_data: Dict[int, Dict[str, Any]] = {}
+    counts: Dict[int, int] = {}
+    if tender_ids or counted_ids:
+        db = SessionLocal()
+        try:
+            for tender in db.scalars(select(Tender).where(Tender.id.in_(tender_ids | counted_ids))):
+                tenders[tender.id] = tender
+            submission_data = {
+                sub.id: SubmissionRead.model_validate(sub).model_dump(mode="json")
+                for sub in db.scalars(select(Submission).where(Submission.id.in_(submission_ids)))
+            }
+            if counted_ids:
+                counts = dict(
+                    db.execute(
+                        select(TenderStats.tender_id, TenderStats.submission_count).where(
+                            TenderStats.tender_id.in_(counted_ids)
+                        )
+                    ).all()
+                )
+            tender_data = {
+                tender_id: TenderRead.model_validate(tender).model_dump(mode="json")
+                for tender_id, tender in tenders.items()
+                if tender_id in tender_ids
+            }
+        finally:
+            db.close()
+
+    events = []
+    for entry in entries:
+        if entry["resource_type"] == "tender" and entry["resource_id"]:
+            tender_id = int(entry["resource_id"])
+            events.append(
+                _event(
+                    "tender",
+                    entry["id"],
+                    {"action": entry["action"], "tender_id": tender_id, "tender": tender_data.get(tender_id)},
+                )
+            )
+        elif entry["action"] == "submission_create":
+            tender_id = entry["payload"]["tender_id"]
+            events.append(
+                _event(
+                    "submission",
+                    entry["id"],
+                    {
+                        "tender_id": tender_id,
+                        "submission_id": int(entry["resource_id"]),
+                        "submission": submission_data.get(int(entry["resource_id"])),
+                    },
+                    roles=frozenset(),
+                    user_ids=[entry["actor_id"]] if entry["actor_id"] else [],
+                )
+            )
+        events.append(
+            _event("audit", entry["id"], jsonable_encoder(entry), roles=_AUDIT_EVENT_ROLES)
+        )
+    for tender_id, count in counts.items():
+        tender = tenders.get(tender_id)
+        events.append(
+            _event(
+                "submission_count",
+                max(entry["id"] for entry in entries),
+                {"tender_id": tender_id, "submission_count": count},
+                roles=_AUDIT_EVENT_ROLES,
+                user_ids=[tender.owner_id] if tender is not None else [],
+            )
+        )
+    event_hub.publish(events)
+
+
+audit_chain.add_listener(publish_audit_events)
+
+
+async def stream_events(subscriber: _EventSubscriber):
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscriber.queue.get(), EVENT_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                return
+            data = json.dumps(event["data"], separators=(",", ":"))
+            yield f"id: {event['id']}\nevent: {event['event']}\ndata: {data}\n\n"
+    finally:
+        event_hub.unsubscribe(subscriber)
+
+
+@app.get("/events")
+async def subscribe_events(
+    db: AsyncSession = Depends(get_async_db),
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    access_token: Optional[str] = Query(None, description="For EventSource, which cannot set headers"),
+):
+    current_user = await get_current_user(db=db, token=token or access_token or "")
+    subscriber = event_hub.subscribe(current_user)
+    return StreamingResponse(
+        stream_events(subscriber),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
 # ------------ Audit routes ------------
 
+def filter_audit_query(
+    query,
+    actor_id: Optional[int] = None,
+    action: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+):
+    if actor_id is not None:
+        query = query.filter(AuditLog.actor_id == actor_id)
+    if action is not None:
+        query = query.filter(AuditLog.action == action)
+    if resource_type is not None:
+        query = query.filter(AuditLog.resource_type == resource_type)
+    if resource_id is not None:
+        query = query.filter(AuditLog.resource_id == resource_id)
+    if created_after is not None:
+        query = query.filter(AuditLog.created_at >= as_utc_naive(created_after))
+    if created_before is not None:
+        query = query.filter(AuditLog.created_at < as_utc_naive(created_before))
+    return query
+
+
 @app.get("/audit", response_model=List[AuditLogRead])
-def list_audit_logs(
-    db: Session = Depends(get_db),
+async def list_audit_logs(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    before_id: Optional[int] = Query(None, description="Return entries older than this id."),
+    actor_id: Optional[int] = None,
+    action: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     if current_user.role not in (UserRole.admin.value, UserRole.auditor.value):
@@ -1035,10 +4242,148 @@ def list_audit_logs(
             status_code=403,
             detail="Not authorised to view audit logs.",
         )
-    logs = db.query(AuditLog).order_by(AuditLog.id.desc()).limit(500).all()
+    query = filter_audit_query(
+        select(AuditLog),
+        actor_id=actor_id,
+        action=action,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        created_after=created_after,
+        created_before=created_before,
+    )
+    if before_id is not None:
+        query = query.filter(AuditLog.id < before_id)
+
+    result = await db.execute(query.order_by(AuditLog.id.desc()).limit(limit))
+    logs = result.scalars().all()
+    # Keyset cursor: pass it back as ``before_id`` to fetch the next page.
+    if len(logs) == limit:
+        response.headers["X-Next-Cursor"] = str(logs[-1].id)
     return logs
 
 
+@app.get("/audit/export")
+def export_audit_logs(
+    format: ExportFormat = ExportFormat.ndjson,
+    gzip: bool = False,
+    actor_id: Optional[int] = None,
+    action: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    current_user: User = Depends(get_current_user),
+):
+    if current_user.role not in (UserRole.admin.value, UserRole.auditor.value):
+        raise HTTPException(
+            status_code=403,
+            detail="Not authorised to export audit logs.",
+        )
+    stmt = filter_audit_query(
+        select(*(getattr(AuditLog, col) for col in AUDIT_EXPORT_COLUMNS)),
+        actor_id=actor_id,
+        action=action,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        created_after=created_after,
+        created_before=created_before,
+    ).order_by(AuditLog.id)
+    return export_response(stmt, AUDIT_EXPORT_COLUMNS, format, gzip, "audit-logs")
+
+
+@app.post("/audit/verify", response_model=AuditVerifyRead)
+def verify_audit_logs(
+    full: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if current_user.role not in (UserRole.admin.value, UserRole.auditor.value):
+        raise HTTPException(
+            status_code=403,
+            detail="Not authorised to verify audit logs.",
+        )
+    return verify_audit_chain(db, full=full)
+
+
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics(request: Request):
+    """Prometheus exposition; set METRICS_TOKEN to require a bearer token."""
+    if METRICS_TOKEN and not hmac.compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {METRICS_TOKEN}"
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    return Response(content=generate_latest(metrics_registry), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/health")
 def health_check():
-    return {"status": "ok", "service": "bettertender-simple"}
+    return {
+        "status": "ok",
+        "service": "bettertender-simple",
+        "password_hashing": password_hasher.stats(),
+    }
+
+
+# ------------ CLI ------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="BetterTender Simple maintenance commands.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    verify = commands.add_parser("verify-audit", help="Verify the audit log hash chain.")
+    verify.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore stored checkpoints and rehash from the first entry.",
+    )
+
+    commands.add_parser("migrate", help="Create missing tables and apply schema migrations.")
+
+    importer = commands.add_parser("import-tenders", help="Bulk-import draft tenders from CSV or NDJSON.")
+    importer.add_argument("path", help="File to import; '-' reads stdin. A .gz suffix is decompressed.")
+    importer.add_argument("--owner", required=True, help="Email of the issuer or admin who will own the tenders.")
+    importer.add_argument("--format", choices=[fmt.value for fmt in ExportFormat], help="Defaults to the file suffix.")
+    importer.add_argument("--batch-size", type=int, default=TENDER_IMPORT_BATCH_SIZE)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        applied = migrate_database(engine)
+        print(json.dumps({"applied": applied, "latest": MIGRATIONS[-1][0]}))
+        return 0
+    if args.command == "import-tenders":
+        migrate_database(engine)
+        db = SessionLocal()
+        try:
+            owner = get_user_by_email(db, args.owner)
+            if owner is None or owner.role not in (UserRole.issuer.value, UserRole.admin.value):
+                print(f"{args.owner} is not an issuer or admin", file=sys.stderr)
+                return 2
+            fmt = ExportFormat(args.format) if args.format else guess_import_format(args.path)
+            raw = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+            with raw:
+                rows = iter_import_rows(open_import_stream(raw, args.path), fmt)
+                outcome = import_tenders(db, rows, owner, args.batch_size, source=os.path.basename(args.path))
+        finally:
+            db.close()
+        print(outcome.model_dump_json())
+        return 0 if outcome.rejected == 0 else 1
+    if args.command == "verify-audit":
+        migrate_database(engine)
+        db = SessionLocal()
+        try:
+            outcome = verify_audit_chain(db, full=args.full)
+        finally:
+            db.close()
+        print(json.dumps(outcome.model_dump()))
+        return 0 if outcome.ok else 1
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+"""Shared fixtures for the test suite.
+
+``bettertender_simple`` reads its configuration at import time, so the
+environment is pointed at a throwaway database and working directory before
+the first import.
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+WORKDIR = tempfile.mkdtemp(prefix="bt-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{WORKDIR}/test.db")
+os.environ.setdefault("TENDER_SCHEDULER_ENABLED", "false")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+_cwd = os.getcwd()
+os.chdir(WORKDIR)  # upload and journal directories are derived from the cwd
+try:
+    import bettertender_simple as bt  # noqa: E402
+finally:
+    os.chdir(_cwd)
+
+DEV_PASSWORD = "ChangeMe123!"
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(bt.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def auth(client):
+    headers = {}
+    for role in ("admin", "issuer", "bidder", "auditor"):
+        response = client.post(
+            "/auth/login",
+            data={"username": f"{role}@sasweb.gov", "password": DEV_PASSWORD},
+        )
+        response.raise_for_status()
+        headers[role] = {"Authorization": "Bearer " + response.json()["access_token"]}
+    return headers
+
+
+@pytest.fixture(scope="session")
+def tender_id(client, auth):
+    """A published tender to attach bids to."""
+    response = client.post(
+        "/tenders",
+        json={"title": "Test tender", "description": "Fixture"},
+        headers=auth["issuer"],
+    )
+    response.raise_for_status()
+    created = response.json()["id"]
+    client.post(f"/tenders/{created}/publish", json={}, headers=auth["issuer"]).raise_for_status()
+    return created
@@ -0,0 +1,127 @@
+"""Audit chain integrity under concurrent writers and pool pressure."""
+import threading
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+import bettertender_simple as bt
+
+POOL_TIMEOUT_SECONDS = 5
+
+
+def _tiny_pool_sessions(pool_size: int):
+    engine = bt.create_engine(
+        bt.DATABASE_URL,
+        connect_args={"check_same_thread": False, "timeout": bt.SQLITE_BUSY_TIMEOUT_MS / 1000},
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=POOL_TIMEOUT_SECONDS,
+    )
+    return engine, sessionmaker(autoflush=False, bind=engine)
+
+
+def _run_threads(count: int, target) -> list:
+    barrier = threading.Barrier(count)
+    errors: list = []
+
+    def worker(n: int) -> None:
+        try:
+            target(n, barrier)
+        except Exception as exc:  # collected and asserted on below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+    return errors
+
+
+def test_audit_appends_do_not_exhaust_pool(client):
+    """Every pooled connection is held by a request waiting on the audit lock."""
+    pool_size = 2
+    engine, Session = _tiny_pool_sessions(pool_size)
+
+    def request(n: int, barrier: threading.Barrier) -> None:
+        db = Session()
+        try:
+            db.execute(select(bt.User.id).limit(1)).first()
+            db.connection()
+            barrier.wait()
+            for i in range(20):
+                if (n + i) % 2:
+                    bt.audit_chain.append(
+                        db, actor_id=None, action="pool_check", resource_type="test"
+                    )
+                else:
+                    with bt.audit_chain.unit_of_work(db) as record:
+                        record(actor_id=None, action="pool_check", resource_type="test")
+        finally:
+            db.close()
+
+    try:
+        assert _run_threads(pool_size, request) == []
+    finally:
+        engine.dispose()
+    with bt.SessionLocal() as db:
+        assert bt.verify_audit_chain(db, full=True).ok
+
+
+def test_audit_chain_is_linear_across_writers(client):
+    """Two writers (as in two worker processes) appending at once do not fork the chain."""
+    writers = [bt.AuditChainWriter(), bt.AuditChainWriter()]
+    engines = []
+
+    def request(n: int, barrier: threading.Barrier) -> None:
+        engine, Session = _tiny_pool_sessions(1)
+        engines.append(engine)
+        barrier.wait()
+        for _ in range(50):
+            with Session() as db:
+                writers[n].append(db, actor_id=None, action="writer_check", resource_type="test")
+
+    try:
+        assert _run_threads(len(writers), request) == []
+    finally:
+        for engine in engines:
+            engine.dispose()
+    with bt.SessionLocal() as db:
+        assert bt.verify_audit_chain(db, full=True).ok
+
+
+def test_verify_detects_tampering_after_concurrent_appends(client):
+    def request(n: int, barrier: threading.Barrier) -> None:
+        barrier.wait()
+        for i in range(25):
+            with bt.SessionLocal() as db:
+                bt.audit_chain.append(
+                    db,
+                    actor_id=n,
+                    action="concurrent_check",
+                    resource_type="test",
+                    payload={"i": i},
+                )
+
+    assert _run_threads(4, request) == []
+    with bt.SessionLocal() as db:
+        result = bt.verify_audit_chain(db, full=True)
+        assert result.ok
+        head = db.get(bt.AuditChainHead, 1)
+        assert head.audit_log_id == result.last_verified_id
+
+        victim = (
+            db.query(bt.AuditLog)
+            .filter(bt.AuditLog.action == "concurrent_check")
+            .order_by(bt.AuditLog.id.desc())
+            .first()
+        )
+        victim.payload = {"i": -1}
+        db.commit()
+        tampered = bt.verify_audit_chain(db, full=True)
+        assert not tampered.ok
+        assert tampered.first_invalid_id == victim.id
+
+        victim.payload = {"i": 24}
+        db.commit()
+        assert bt.verify_audit_chain(db, full=True).ok
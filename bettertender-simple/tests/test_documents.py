@@ -0,0 +1,76 @@
+"""Content-addressed document storage: blob reference counts and cleanup."""
+import os
+import uuid
+
+import bettertender_simple as bt
+
+
+def _upload(client, headers, content: bytes, name: str = "spec.pdf") -> dict:
+    response = client.post("/documents", files={"file": (name, content)}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _blob(checksum: str):
+    with bt.SessionLocal() as db:
+        return db.get(bt.DocumentBlob, checksum)
+
+
+def test_identical_uploads_share_one_blob(client, auth):
+    content = uuid.uuid4().bytes * 1024
+    first = _upload(client, auth["bidder"], content, "a.pdf")
+    second = _upload(client, auth["issuer"], content, "b.pdf")
+
+    assert first["stored_path"] == second["stored_path"]
+    blob = _blob(first["checksum"])
+    assert blob.ref_count == 2
+    assert blob.size_bytes == len(content)
+    assert not [name for name in os.listdir(bt.BLOB_DIR) if name.startswith(".upload-")]
+
+    response = client.delete(f"/documents/{first['id']}", headers=auth["bidder"])
+    assert response.status_code == 204
+    assert _blob(first["checksum"]).ref_count == 1
+    with open(second["stored_path"], "rb") as fh:
+        assert fh.read() == content
+
+    response = client.delete(f"/documents/{second['id']}", headers=auth["issuer"])
+    assert response.status_code == 204
+    assert _blob(first["checksum"]) is None
+    blob_dir = os.path.dirname(second["stored_path"])
+    assert not os.path.exists(second["stored_path"])
+    assert not [name for name in os.listdir(blob_dir) if ".deleted-" in name]
+
+
+def test_reupload_after_last_reference_is_dropped(client, auth):
+    content = uuid.uuid4().bytes * 64
+    doc = _upload(client, auth["bidder"], content)
+    assert client.delete(f"/documents/{doc['id']}", headers=auth["bidder"]).status_code == 204
+
+    again = _upload(client, auth["bidder"], content)
+    assert _blob(again["checksum"]).ref_count == 1
+    with open(again["stored_path"], "rb") as fh:
+        assert fh.read() == content
+
+
+def test_legacy_document_keeps_its_own_file(client, auth, tmp_path):
+    content = uuid.uuid4().bytes * 64
+    shared = _upload(client, auth["bidder"], content)
+
+    legacy_path = tmp_path / "legacy.pdf"
+    legacy_path.write_bytes(content)
+    with bt.SessionLocal() as db:
+        bidder = db.query(bt.User).filter(bt.User.email == "bidder@sasweb.gov").one()
+        legacy = bt.Document(
+            owner_id=bidder.id,
+            original_filename="legacy.pdf",
+            stored_path=str(legacy_path),
+            checksum=shared["checksum"],
+        )
+        db.add(legacy)
+        db.commit()
+        legacy_id = legacy.id
+
+    assert client.delete(f"/documents/{legacy_id}", headers=auth["bidder"]).status_code == 204
+    assert not legacy_path.exists()
+    assert _blob(shared["checksum"]).ref_count == 1
+    assert os.path.exists(shared["stored_path"])
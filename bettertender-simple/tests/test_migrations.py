@@ -0,0 +1,124 @@
+"""Schema migrations applied to a database created by the original release."""
+from sqlalchemy import create_engine, inspect, text
+
+import bettertender_simple as bt
+
+# Tables as the first release's create_all() left them, before any migration.
+BASELINE_SCHEMA = [
+    """CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        email VARCHAR(255) NOT NULL UNIQUE,
+        hashed_password VARCHAR(255) NOT NULL,
+        full_name VARCHAR(255),
+        role VARCHAR(32) NOT NULL,
+        is_active BOOLEAN,
+        created_at DATETIME
+    )""",
+    """CREATE TABLE tenders (
+        id INTEGER PRIMARY KEY,
+        owner_id INTEGER NOT NULL REFERENCES users (id),
+        title VARCHAR(255) NOT NULL,
+        description TEXT NOT NULL,
+        estimated_budget INTEGER,
+        status VARCHAR(9) NOT NULL,
+        publish_at DATETIME,
+        close_at DATETIME,
+        created_at DATETIME
+    )""",
+    """CREATE TABLE submissions (
+        id INTEGER PRIMARY KEY,
+        tender_id INTEGER NOT NULL REFERENCES tenders (id),
+        bidder_id INTEGER REFERENCES users (id),
+        is_anonymous BOOLEAN NOT NULL,
+        amount FLOAT,
+        notes VARCHAR,
+        created_at DATETIME NOT NULL,
+        company_name VARCHAR,
+        bbbee_level VARCHAR,
+        years_in_service INTEGER,
+        tax_number VARCHAR,
+        csd_number VARCHAR
+    )""",
+    """CREATE TABLE documents (
+        id INTEGER PRIMARY KEY,
+        owner_id INTEGER NOT NULL REFERENCES users (id),
+        tender_id INTEGER REFERENCES tenders (id),
+        filename VARCHAR NOT NULL,
+        storage_path VARCHAR NOT NULL,
+        visibility VARCHAR NOT NULL,
+        uploaded_at DATETIME NOT NULL
+    )""",
+    """CREATE TABLE audit_logs (
+        id INTEGER PRIMARY KEY,
+        actor_id INTEGER,
+        action VARCHAR(100) NOT NULL,
+        resource_type VARCHAR(50) NOT NULL,
+        resource_id VARCHAR(64),
+        payload JSON,
+        created_at DATETIME,
+        immutable_signature VARCHAR(128) NOT NULL
+    )""",
+    "CREATE INDEX ix_users_id ON users (id)",
+    "CREATE UNIQUE INDEX ix_users_email ON users (email)",
+    "CREATE INDEX ix_tenders_id ON tenders (id)",
+    "CREATE INDEX ix_tenders_owner_id ON tenders (owner_id)",
+    "CREATE INDEX ix_tenders_title ON tenders (title)",
+    "CREATE INDEX ix_submissions_id ON submissions (id)",
+    "CREATE INDEX ix_documents_id ON documents (id)",
+    "CREATE INDEX ix_audit_logs_id ON audit_logs (id)",
+    "CREATE INDEX ix_audit_logs_actor_id ON audit_logs (actor_id)",
+    "CREATE INDEX ix_audit_logs_immutable_signature ON audit_logs (immutable_signature)",
+]
+
+
+def _baseline_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/baseline.db")
+    with engine.begin() as conn:
+        for ddl in BASELINE_SCHEMA:
+            conn.execute(text(ddl))
+        conn.execute(
+            text(
+                "INSERT INTO audit_logs (actor_id, action, resource_type, created_at, immutable_signature)"
+                " VALUES (NULL, 'seed', 'test', '2020-01-01 00:00:00', 'a1'),"
+                " (NULL, 'seed', 'test', '2020-01-01 00:00:01', 'b2')"
+            )
+        )
+    return engine
+
+
+def test_migrations_upgrade_baseline_database(tmp_path):
+    engine = _baseline_engine(tmp_path)
+    try:
+        assert bt.migrate_database(engine) == [version for version, _, _ in bt.MIGRATIONS]
+
+        inspector = inspect(engine)
+        for model in (bt.Submission, bt.Document, bt.Tender, bt.AuditLog):
+            table = model.__tablename__
+            columns = {col["name"] for col in inspector.get_columns(table)}
+            assert columns == {col.name for col in model.__table__.columns}, table
+            indexes = {index["name"] for index in inspector.get_indexes(table)}
+            assert {index.name for index in model.__table__.indexes} <= indexes, table
+
+        with engine.connect() as conn:
+            head = conn.execute(
+                text("SELECT audit_log_id, immutable_signature FROM audit_chain_head WHERE id = 1")
+            ).one()
+        assert tuple(head) == (2, "b2")
+
+        assert bt.migrate_database(engine) == []
+    finally:
+        engine.dispose()
+
+
+def test_migrations_leave_fresh_database_untouched(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/fresh.db")
+    try:
+        applied = bt.migrate_database(engine)
+        assert applied == [version for version, _, _ in bt.MIGRATIONS]
+        with engine.connect() as conn:
+            head = conn.execute(
+                text("SELECT audit_log_id, immutable_signature FROM audit_chain_head")
+            ).all()
+        assert [tuple(row) for row in head] == [(None, None)]
+    finally:
+        engine.dispose()
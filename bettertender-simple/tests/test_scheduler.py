@@ -0,0 +1,51 @@
+"""Deadline scheduler bookkeeping: one live transition per tender."""
+import time
+from datetime import datetime, timedelta
+
+import bettertender_simple as bt
+
+
+def _published(tender_id: int, close_in: timedelta) -> bt.Tender:
+    return bt.Tender(
+        id=tender_id,
+        status=bt.TenderStatus.published,
+        close_at=datetime.utcnow() + close_in,
+    )
+
+
+def test_disabled_scheduler_only_tracks_status():
+    scheduler = bt.TenderDeadlineScheduler(bt.SessionLocal, enabled=False)
+    scheduler.track(_published(1, timedelta(hours=1)))
+    assert scheduler._heap == []
+    assert scheduler.accepts_submissions(1)
+
+
+def test_retracking_replaces_the_pending_transition():
+    scheduler = bt.TenderDeadlineScheduler(bt.SessionLocal)
+    tender = _published(1, timedelta(hours=1))
+    scheduler.track(tender)
+    scheduler.track(tender)
+    assert len(scheduler._heap) == 1
+
+    later = _published(1, timedelta(hours=2))
+    scheduler.track(later)
+    assert scheduler._due[1] == (later.close_at, "close")
+
+    scheduler.track(bt.Tender(id=1, status=bt.TenderStatus.closed))
+    assert 1 not in scheduler._due
+
+
+def test_superseded_deadline_is_skipped():
+    scheduler = bt.TenderDeadlineScheduler(bt.SessionLocal)
+    fired = []
+    scheduler._fire = lambda tender_id, action: fired.append((tender_id, action))
+    scheduler.track(_published(1, timedelta(milliseconds=200)))
+    scheduler.track(_published(1, timedelta(hours=1)))
+    scheduler.track(_published(2, timedelta(milliseconds=200)))
+    scheduler.start()
+    try:
+        time.sleep(0.5)
+    finally:
+        scheduler.stop()
+    assert fired == [(2, "close")]
+    assert 1 in scheduler._due
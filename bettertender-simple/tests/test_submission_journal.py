@@ -0,0 +1,128 @@
+"""Submission ingest journal: replay after a crash and orphaned journals."""
+import json
+import os
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+import bettertender_simple as bt
+
+
+def _record(tender_id: int, amount: float, receipt_id: str = None) -> dict:
+    return {
+        "receipt_id": receipt_id or uuid.uuid4().hex,
+        "received_at": "2026-01-01T00:00:00",
+        "actor_id": None,
+        "fields": {
+            "tender_id": tender_id,
+            "bidder_id": None,
+            "is_anonymous": False,
+            "anonymous_commitment": None,
+            "anonymous_nonce_hint": None,
+            "encrypted_payload": None,
+            "amount": amount,
+            "notes": None,
+        },
+    }
+
+
+def _line(record: dict) -> bytes:
+    return (json.dumps(record) + "\n").encode()
+
+
+def _stored(receipts) -> set:
+    with bt.SessionLocal() as db:
+        return set(
+            db.scalars(
+                select(bt.Submission.receipt_id).where(bt.Submission.receipt_id.in_(receipts))
+            )
+        )
+
+
+def test_append_drains_and_truncates_journal(client, tender_id, tmp_path):
+    queue = bt.SubmissionIngestQueue(str(tmp_path / "submissions.ndjson"), bt.SessionLocal, 10)
+    queue.start()
+    records = [_record(tender_id, i) for i in range(25)]
+    try:
+        for record in records:
+            queue.append(record)
+    finally:
+        queue.stop()
+    receipts = [rec["receipt_id"] for rec in records]
+    assert _stored(receipts) == set(receipts)
+    assert all(queue.status(receipt) is None for receipt in receipts)
+    assert os.path.getsize(queue._path) == 0
+
+
+def test_replay_after_crash_skips_torn_tail_and_duplicates(client, tender_id, tmp_path):
+    queue = bt.SubmissionIngestQueue(str(tmp_path / "submissions.ndjson"), bt.SessionLocal, 10)
+    committed = _record(tender_id, 1)
+    pending = _record(tender_id, 2)
+    queue.start()
+    queue.append(committed)
+    queue.stop()
+
+    # As left by a crash: one bid already stored, one not, and a torn write.
+    with open(queue._path, "ab") as fh:
+        fh.write(_line(committed) + _line(pending) + b'{"receipt_id": "tor')
+    queue.start()
+    queue.stop()
+
+    assert _stored([committed["receipt_id"], pending["receipt_id"]]) == {
+        committed["receipt_id"],
+        pending["receipt_id"],
+    }
+    with bt.SessionLocal() as db:
+        count = (
+            db.query(bt.Submission)
+            .filter(bt.Submission.receipt_id == committed["receipt_id"])
+            .count()
+        )
+    assert count == 1
+    assert os.path.getsize(queue._path) == 0
+
+
+def test_start_adopts_orphaned_journals(client, tender_id, tmp_path):
+    base = str(tmp_path / "submissions.ndjson")
+    orphan, rejected, legacy = (_record(tender_id, amount) for amount in (3, 4, 5))
+    with open(f"{base}.999999", "wb") as fh:
+        fh.write(_line(orphan))
+    with open(f"{base}.999999.rejected", "wb") as fh:
+        fh.write(_line(rejected))
+    with open(base, "wb") as fh:
+        fh.write(_line(legacy))
+
+    queue = bt.SubmissionIngestQueue(base, bt.SessionLocal, 10)
+    queue.start()
+    queue.stop()
+
+    receipts = {rec["receipt_id"] for rec in (orphan, rejected, legacy)}
+    assert _stored(receipts) == receipts
+    assert sorted(os.listdir(tmp_path)) == [os.path.basename(queue._path)]
+
+
+@pytest.mark.skipif(bt.fcntl is None, reason="journal locking needs flock")
+def test_journal_held_by_running_worker_is_left_alone(client, tender_id, tmp_path):
+    base = str(tmp_path / "submissions.ndjson")
+    live = bt.SubmissionIngestQueue(base, bt.SessionLocal, 10)
+    # Stand in for another worker process holding its journal open.
+    live._path = f"{base}.888888"
+    live._open()
+    live_record = _record(tender_id, 6)
+    live._file.write(_line(live_record))
+    live._file.flush()
+
+    queue = bt.SubmissionIngestQueue(base, bt.SessionLocal, 10)
+    try:
+        queue.start()
+        queue.stop()
+        assert os.path.exists(live._path)
+        assert _stored([live_record["receipt_id"]]) == set()
+    finally:
+        live._file.close()
+
+    queue.start()
+    queue.stop()
+    assert not os.path.exists(live._path)
+    assert _stored([live_record["receipt_id"]]) == {live_record["receipt_id"]}